@@ -9,129 +9,192 @@ The preserve_text_values parameter solves the issue of numeric IDs being display
 in the UI instead of human-readable text.
 """
 
-from typing import Any, Dict
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
 from open_to_close import PropertiesAPI
 
+# Bound on in-flight requests for rate-limit safety
+MAX_CONCURRENT_CREATES = 10
+
+# Lowercase status -> UI title case mapping, built once at import time so
+# format_status_for_ui does not rebuild the dict on every call
+STATUS_MAPPING = {
+    "under contract": "Under Contract",
+    "active": "Listing- Active",
+    "closed": "Closed",
+    "pre-mls": "Listing - Pre-MLS",
+    "terminated": "Contract Terminated",
+}
+
+# Lowercase client type -> UI title case mapping. The set of client types is
+# fixed, so a single dict lookup replaces per-call .title()/.lower() chains
+CLIENT_TYPE_MAPPING = {
+    "buyer": "Buyer",
+    "seller": "Seller",
+    "dual": "Dual",
+}
+
+# Section 3 reference values, hoisted to module-level tuples of interned
+# strings: tuples are allocated once at import, and interning keeps a single
+# canonical object per value for cheap identity-based dict/set lookups
+CLIENT_TYPES = tuple(sys.intern(value) for value in ("Buyer", "Seller", "Dual"))
+STATUS_VALUES = tuple(
+    sys.intern(value)
+    for value in (
+        "Under Contract",
+        "Listing- Active",
+        "Closed",
+        "Contract Terminated",
+        "Listing - Pre-MLS",
+    )
+)
+PROPERTY_TYPES = tuple(
+    sys.intern(value)
+    for value in (
+        "Single Family Residential",
+        "Condo",
+        "Townhouse",
+        "Multi-Family Dwelling",
+        "Vacant Land",
+    )
+)
+
+
+def create_properties_concurrently(
+    client: PropertiesAPI, payloads: List[Tuple[Dict[str, Any], bool]]
+) -> List[Dict[str, Any]]:
+    """Create independent properties in parallel over a bounded worker pool.
+
+    The creates are independent, so firing them concurrently collapses N
+    sequential round-trips into roughly one round-trip of wall time.
+
+    Args:
+        client: Properties client to create with
+        payloads: List of (property_data, preserve_text_values) tuples
+
+    Returns:
+        Created properties in the same order as the input payloads
+    """
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CREATES) as executor:
+        futures = [
+            executor.submit(client.create_property, data, preserve_text_values=preserve)
+            for data, preserve in payloads
+        ]
+        return [future.result() for future in futures]
+
 
 def demonstrate_preserve_text_values() -> None:
     """Demonstrate the preserve_text_values feature with comprehensive examples."""
 
-    print("🆕 Open To Close - preserve_text_values Feature (v2.6.0)")
-    print("=" * 65)
-    print("Solving the UI display issue: Text values instead of numeric IDs")
-    print()
+    # Buffer the demo output and flush it once at the end, instead of paying
+    # one write syscall per print statement
+    out = io.StringIO()
+    echo = partial(print, file=out)
+
+    echo("🆕 Open To Close - preserve_text_values Feature (v2.6.0)")
+    echo("=" * 65)
+    echo("Solving the UI display issue: Text values instead of numeric IDs")
+    echo()
 
     client = PropertiesAPI()
 
     # Section 1: The Problem and Solution
-    print("🔍 SECTION 1: Understanding the Problem")
-    print("-" * 45)
-
-    print("\n❌ Problem: Default behavior converts text to numeric IDs")
-    default_property = client.create_property(
-        {
-            "title": "Traditional Property Creation",
-            "client_type": "buyer",  # Becomes 797212
-            "status": "under contract",  # Becomes 797209
-        }
+    echo("🔍 SECTION 1: Understanding the Problem")
+    echo("-" * 45)
+
+    # Both demonstration properties are independent, so create them in parallel
+    default_property, ui_friendly_property = create_properties_concurrently(
+        client,
+        [
+            (
+                {
+                    "title": "Traditional Property Creation",
+                    "client_type": "buyer",  # Becomes 797212
+                    "status": "under contract",  # Becomes 797209
+                },
+                False,
+            ),
+            (
+                {
+                    "title": "UI-Friendly Property Creation",
+                    "client_type": "Buyer",  # Stays as "Buyer"
+                    "status": "Under Contract",  # Stays as "Under Contract"
+                },
+                True,
+            ),
+        ],
     )
-    print(f"   Created Property ID: {default_property['id']}")
-    print("   Result: UI shows '797212' and '797209' instead of readable text")
 
-    print("\n✅ Solution: preserve_text_values keeps human-readable text")
-    ui_friendly_property = client.create_property(
+    echo("\n❌ Problem: Default behavior converts text to numeric IDs")
+    echo(f"   Created Property ID: {default_property['id']}")
+    echo("   Result: UI shows '797212' and '797209' instead of readable text")
+
+    echo("\n✅ Solution: preserve_text_values keeps human-readable text")
+    echo(f"   Created Property ID: {ui_friendly_property['id']}")
+    echo("   Result: UI shows 'Buyer' and 'Under Contract' (readable!)")
+
+    # Section 2: Title Case Requirements
+    echo("\n\n📝 SECTION 2: Title Case Requirements for UI Recognition")
+    echo("-" * 58)
+
+    # Buyer, seller, and dual agency examples batched into one call
+    title_case_payloads = [
+        {
+            "title": "Beautiful Single Family Home",
+            "client_type": "Buyer",
+            "status": "Under Contract",
+            "purchase_amount": 450000,
+        },
         {
-            "title": "UI-Friendly Property Creation",
-            "client_type": "Buyer",  # Stays as "Buyer"
-            "status": "Under Contract",  # Stays as "Under Contract"
+            "title": "Luxury Downtown Condo",
+            "client_type": "Seller",
+            "status": "Listing- Active",
+            "purchase_amount": 625000,
         },
-        preserve_text_values=True,
-    )
-    print(f"   Created Property ID: {ui_friendly_property['id']}")
-    print("   Result: UI shows 'Buyer' and 'Under Contract' (readable!)")
+        {
+            "title": "Investment Property Opportunity",
+            "client_type": "Dual",
+            "status": "Closed",
+            "purchase_amount": 375000,
+        },
+    ]
 
-    # Section 2: Title Case Requirements
-    print("\n\n📝 SECTION 2: Title Case Requirements for UI Recognition")
-    print("-" * 58)
-
-    # Create buyer property example
-    print("\n1. Buyer Properties:")
-    buyer_data = {
-        "title": "Beautiful Single Family Home",
-        "client_type": "Buyer",
-        "status": "Under Contract",
-        "purchase_amount": 450000,
-    }
-    print(f"   Title Case Values: {buyer_data['client_type']}, {buyer_data['status']}")
-    buyer_property = client.create_property(buyer_data, preserve_text_values=True)
-    print(f"   ✅ Created Property ID: {buyer_property['id']}")
-    print("   🎯 UI will recognize and preselect these values correctly")
-
-    # Create seller property example
-    print("\n2. Seller Properties:")
-    seller_data = {
-        "title": "Luxury Downtown Condo",
-        "client_type": "Seller",
-        "status": "Listing- Active",
-        "purchase_amount": 625000,
-    }
-    print(
-        f"   Title Case Values: {seller_data['client_type']}, {seller_data['status']}"
+    title_case_properties = client.create_properties_bulk(
+        title_case_payloads, preserve_text_values=True
     )
-    seller_property = client.create_property(seller_data, preserve_text_values=True)
-    print(f"   ✅ Created Property ID: {seller_property['id']}")
-    print("   🎯 UI will recognize and preselect these values correctly")
-
-    # Create dual agency example
-    print("\n3. Dual Agency:")
-    dual_data = {
-        "title": "Investment Property Opportunity",
-        "client_type": "Dual",
-        "status": "Closed",
-        "purchase_amount": 375000,
-    }
-    print(f"   Title Case Values: {dual_data['client_type']}, {dual_data['status']}")
-    dual_property = client.create_property(dual_data, preserve_text_values=True)
-    print(f"   ✅ Created Property ID: {dual_property['id']}")
-    print("   🎯 UI will recognize and preselect these values correctly")
+
+    for index, (payload, created) in enumerate(
+        zip(title_case_payloads, title_case_properties), start=1
+    ):
+        echo(f"\n{index}. {payload['client_type']} Properties:")
+        echo(f"   Title Case Values: {payload['client_type']}, {payload['status']}")
+        echo(f"   ✅ Created Property ID: {created['id']}")
+        echo("   🎯 UI will recognize and preselect these values correctly")
 
     # Section 3: Common Title Case Values Reference
-    print("\n\n📚 SECTION 3: Common Title Case Values Reference")
-    print("-" * 52)
+    echo("\n\n📚 SECTION 3: Common Title Case Values Reference")
+    echo("-" * 52)
 
-    print("\n✅ Client Types (Exact case required):")
-    client_types = ["Buyer", "Seller", "Dual"]
-    for client_type in client_types:
-        print(f"   • '{client_type}'")
+    # Join each reference list into one string instead of formatting and
+    # emitting a line per value
+    echo("\n✅ Client Types (Exact case required):")
+    echo("\n".join(f"   • '{client_type}'" for client_type in CLIENT_TYPES))
 
-    print("\n✅ Common Status Values (Exact case required):")
-    status_values = [
-        "Under Contract",
-        "Listing- Active",
-        "Closed",
-        "Contract Terminated",
-        "Listing - Pre-MLS",
-    ]
-    for status in status_values:
-        print(f"   • '{status}'")
+    echo("\n✅ Common Status Values (Exact case required):")
+    echo("\n".join(f"   • '{status}'" for status in STATUS_VALUES))
 
-    print("\n✅ Property Types (Exact case required):")
-    property_types = [
-        "Single Family Residential",
-        "Condo",
-        "Townhouse",
-        "Multi-Family Dwelling",
-        "Vacant Land",
-    ]
-    for prop_type in property_types:
-        print(f"   • '{prop_type}'")
+    echo("\n✅ Property Types (Exact case required):")
+    echo("\n".join(f"   • '{prop_type}'" for prop_type in PROPERTY_TYPES))
 
     # Section 4: Real-World Integration Example
-    print("\n\n🏗️ SECTION 4: Real-World Integration Example")
-    print("-" * 48)
+    echo("\n\n🏗️ SECTION 4: Real-World Integration Example")
+    echo("-" * 48)
 
-    print("\nIntegrating with external systems (CRM, MLS, etc.):")
+    echo("\nIntegrating with external systems (CRM, MLS, etc.):")
 
     # Simulate external data with proper formatting
     external_property_data = {
@@ -143,14 +206,14 @@ def demonstrate_preserve_text_values() -> None:
         "price": 425000,
     }
 
-    print(f"External data: {external_property_data}")
+    echo(f"External data: {external_property_data}")
 
     # Transform for Open to Close with proper title case
     otc_data = {
         "title": f"{external_property_data['address']}, {external_property_data['city']}, {external_property_data['state']}",
-        "client_type": str(
-            external_property_data["client_relationship"]
-        ).title(),  # Convert to "Buyer"
+        "client_type": format_client_type_for_ui(
+            str(external_property_data["client_relationship"])
+        ),  # Convert to "Buyer"
         "status": "Under Contract",  # Map to proper Open to Close status
         "purchase_amount": external_property_data["price"],
         "property_address": external_property_data["address"],
@@ -158,83 +221,87 @@ def demonstrate_preserve_text_values() -> None:
         "property_state": external_property_data["state"],
     }
 
-    integration_property = client.create_property(otc_data, preserve_text_values=True)
+    # The integration and UI-recognition test properties are independent,
+    # so fire them in parallel as well
+    integration_property, test_property = create_properties_concurrently(
+        client,
+        [
+            (otc_data, True),
+            (
+                {
+                    "title": "UI Recognition Test Property",
+                    "client_type": "Buyer",
+                    "status": "Under Contract",
+                },
+                True,
+            ),
+        ],
+    )
 
-    print(f"\n✅ Integration Property ID: {integration_property['id']}")
-    print("🎯 Properly formatted for UI recognition!")
+    echo(f"\n✅ Integration Property ID: {integration_property['id']}")
+    echo("🎯 Properly formatted for UI recognition!")
 
     # Section 5: Testing UI Recognition
-    print("\n\n🧪 SECTION 5: Testing UI Recognition")
-    print("-" * 41)
-
-    test_property = client.create_property(
-        {
-            "title": "UI Recognition Test Property",
-            "client_type": "Buyer",
-            "status": "Under Contract",
-        },
-        preserve_text_values=True,
-    )
+    echo("\n\n🧪 SECTION 5: Testing UI Recognition")
+    echo("-" * 41)
 
-    print(f"\n🧪 Test Property Created: ID {test_property['id']}")
-    print("\n📋 Manual UI Test Steps:")
-    print("1. Open this property in the Open to Close web interface")
-    print("2. Check the client type dropdown - should show 'Buyer' selected")
-    print("3. Check the status dropdown - should show 'Under Contract' selected")
-    print("4. If dropdowns show correct selections → ✅ Success!")
-    print("5. If dropdowns show wrong/empty selections → ❌ Check title case")
+    echo(f"\n🧪 Test Property Created: ID {test_property['id']}")
+    echo("\n📋 Manual UI Test Steps:")
+    echo("1. Open this property in the Open to Close web interface")
+    echo("2. Check the client type dropdown - should show 'Buyer' selected")
+    echo("3. Check the status dropdown - should show 'Under Contract' selected")
+    echo("4. If dropdowns show correct selections → ✅ Success!")
+    echo("5. If dropdowns show wrong/empty selections → ❌ Check title case")
 
     # Section 6: Summary and Best Practices
-    print("\n\n📖 SECTION 6: Summary and Best Practices")
-    print("-" * 46)
-
-    print("\n🎯 When to use preserve_text_values=True:")
-    print("   • When UI display and recognition matters")
-    print("   • For properties that will be viewed/edited in Open to Close UI")
-    print("   • When integrating with external systems")
-    print("   • For better user experience and data consistency")
-
-    print("\n🎯 When to use default behavior (preserve_text_values=False):")
-    print("   • API-only integrations without UI interaction")
-    print("   • Backwards compatibility with existing code")
-    print("   • When you prefer numeric IDs for your workflow")
-
-    print("\n💡 Best Practices:")
-    print("   • Always use proper title case with preserve_text_values=True")
-    print("   • Test UI recognition after creating properties")
-    print("   • Document the title case requirements for your team")
-    print("   • Consider creating helper functions for consistent formatting")
-
-    print("\n✨ Helper Function Example:")
-    print(
-        """
+    echo("\n\n📖 SECTION 6: Summary and Best Practices")
+    echo("-" * 46)
+
+    echo("\n🎯 When to use preserve_text_values=True:")
+    echo("   • When UI display and recognition matters")
+    echo("   • For properties that will be viewed/edited in Open to Close UI")
+    echo("   • When integrating with external systems")
+    echo("   • For better user experience and data consistency")
+
+    echo("\n🎯 When to use default behavior (preserve_text_values=False):")
+    echo("   • API-only integrations without UI interaction")
+    echo("   • Backwards compatibility with existing code")
+    echo("   • When you prefer numeric IDs for your workflow")
+
+    echo("\n💡 Best Practices:")
+    echo("   • Always use proper title case with preserve_text_values=True")
+    echo("   • Test UI recognition after creating properties")
+    echo("   • Document the title case requirements for your team")
+    echo("   • Consider creating helper functions for consistent formatting")
+
+    echo("\n✨ Helper Function Example:")
+    echo("""
     def create_ui_friendly_property(title, client_type, status, **kwargs):
         \"\"\"Create property with proper title case for UI recognition.\"\"\"
         # Ensure proper title case
         formatted_data = {
             'title': title,
-            'client_type': client_type.title() if client_type.lower() in ['buyer', 'seller', 'dual'] else client_type,
+            'client_type': format_client_type_for_ui(client_type),  # Precomputed lookup table
             'status': format_status_for_ui(status),  # Custom status formatter
             **kwargs
         }
         return client.properties.create_property(formatted_data, preserve_text_values=True)
-    """
-    )
+    """)
 
-    print(f"\n🎉 preserve_text_values demonstration complete!")
-    print(f"📚 See docs/api/properties.md for detailed documentation")
+    echo(f"\n🎉 preserve_text_values demonstration complete!")
+    echo(f"📚 See docs/api/properties.md for detailed documentation")
+
+    sys.stdout.write(out.getvalue())
 
 
 def format_status_for_ui(status: str) -> str:
     """Helper function to format status values for UI recognition."""
-    status_mapping = {
-        "under contract": "Under Contract",
-        "active": "Listing- Active",
-        "closed": "Closed",
-        "pre-mls": "Listing - Pre-MLS",
-        "terminated": "Contract Terminated",
-    }
-    return status_mapping.get(status.lower(), status)
+    return STATUS_MAPPING.get(status.lower(), status)
+
+
+def format_client_type_for_ui(client_type: str) -> str:
+    """Helper function to format client type values for UI recognition."""
+    return CLIENT_TYPE_MAPPING.get(client_type.lower(), client_type)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,8 @@
 """Open To Close API Python Client."""
 
-# Import service clients
-from .agents import AgentsAPI
-from .client import OpenToCloseAPI
-from .contacts import ContactsAPI
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -16,15 +15,21 @@ from .exceptions import (
     TimeoutError,
     ValidationError,
 )
-from .properties import PropertiesAPI
-from .property_contacts import PropertyContactsAPI
-from .property_documents import PropertyDocumentsAPI
-from .property_emails import PropertyEmailsAPI
-from .property_notes import PropertyNotesAPI
-from .property_tasks import PropertyTasksAPI
-from .tags import TagsAPI
-from .teams import TeamsAPI
-from .users import UsersAPI
+
+if TYPE_CHECKING:
+    from .agents import AgentsAPI
+    from .async_base_client import AsyncBaseClient
+    from .client import OpenToCloseAPI
+    from .contacts import ContactsAPI
+    from .properties import PropertiesAPI
+    from .property_contacts import PropertyContactsAPI
+    from .property_documents import PropertyDocumentsAPI
+    from .property_emails import PropertyEmailsAPI
+    from .property_notes import PropertyNotesAPI
+    from .property_tasks import PropertyTasksAPI
+    from .tags import TagsAPI
+    from .teams import TeamsAPI
+    from .users import UsersAPI
 
 __version__ = "2.7.0"
 __all__ = [
@@ -41,6 +46,8 @@ __all__ = [
     "TagsAPI",
     "TeamsAPI",
     "UsersAPI",
+    # Async client (requires the optional httpx dependency)
+    "AsyncBaseClient",
     # Exceptions
     "OpenToCloseAPIError",
     "AuthenticationError",
@@ -53,3 +60,39 @@ __all__ = [
     "ConfigurationError",
     "DataFormatError",
 ]
+
+# Client classes are resolved on first attribute access (PEP 562) so that
+# importing the package does not pay to parse and execute every service
+# module up front; callers using a single service load only what they touch
+_LAZY_IMPORTS = {
+    "OpenToCloseAPI": ".client",
+    "AgentsAPI": ".agents",
+    "ContactsAPI": ".contacts",
+    "PropertiesAPI": ".properties",
+    "PropertyContactsAPI": ".property_contacts",
+    "PropertyDocumentsAPI": ".property_documents",
+    "PropertyEmailsAPI": ".property_emails",
+    "PropertyNotesAPI": ".property_notes",
+    "PropertyTasksAPI": ".property_tasks",
+    "TagsAPI": ".tags",
+    "TeamsAPI": ".teams",
+    "UsersAPI": ".users",
+    "AsyncBaseClient": ".async_base_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported client classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the module so subsequent accesses skip this hook entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include the lazily imported names alongside the loaded ones."""
+    return sorted(set(__all__) | set(globals()))
@@ -1,8 +1,11 @@
 """Agents client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +20,30 @@ class AgentsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the agents client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized AgentsAPI client")
 
     def _validate_agent_data(self, agent_data: Dict[str, Any], operation: str) -> None:
@@ -88,7 +102,7 @@ class AgentsAPI(BaseClient):
                     f"license_number must be a non-empty string, got: {license_num}"
                 )
 
-        logger.debug(f"Agent data validated for {operation} operation")
+        logger.debug("Agent data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -123,7 +137,7 @@ class AgentsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -188,11 +202,11 @@ class AgentsAPI(BaseClient):
             response = self.get("/agents", params=validated_params)
             result = self._process_list_response(response, "/agents")
 
-            logger.info(f"Successfully retrieved {len(result)} agents")
+            logger.info("Successfully retrieved %d agents", len(result))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list agents: {str(e)}", extra={"params": params})
+            logger.error("Failed to list agents: %s", e, extra={"params": params})
             raise
 
     def create_agent(self, agent_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,12 +255,13 @@ class AgentsAPI(BaseClient):
             result = self._process_response_data(response, "/agents")
 
             agent_id = result.get("id")
-            logger.info(f"Successfully created agent with ID: {agent_id}")
+            logger.info("Successfully created agent with ID: %s", agent_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create agent: {str(e)}",
+                "Failed to create agent: %s",
+                e,
                 extra={
                     "agent_data_keys": (
                         list(agent_data.keys())
@@ -284,15 +299,15 @@ class AgentsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(agent_id, "agent")
 
-            logger.info(f"Retrieving agent with ID: {validated_id}")
+            logger.info("Retrieving agent with ID: %s", validated_id)
             response = self.get(f"/agents/{validated_id}")
             result = self._process_response_data(response, f"/agents/{validated_id}")
 
-            logger.info(f"Successfully retrieved agent: {validated_id}")
+            logger.info("Successfully retrieved agent: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve agent {agent_id}: {str(e)}")
+            logger.error("Failed to retrieve agent %s: %s", agent_id, e)
             raise
 
     def update_agent(self, agent_id: int, agent_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -330,18 +345,21 @@ class AgentsAPI(BaseClient):
             self._validate_agent_data(agent_data, "update")
 
             logger.info(
-                f"Updating agent with ID: {validated_id}",
+                "Updating agent with ID: %s",
+                validated_id,
                 extra={"update_fields": list(agent_data.keys())},
             )
             response = self.put(f"/agents/{validated_id}", json_data=agent_data)
             result = self._process_response_data(response, f"/agents/{validated_id}")
 
-            logger.info(f"Successfully updated agent: {validated_id}")
+            logger.info("Successfully updated agent: %s", validated_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update agent {agent_id}: {str(e)}",
+                "Failed to update agent %s: %s",
+                agent_id,
+                e,
                 extra={
                     "agent_data_keys": (
                         list(agent_data.keys())
@@ -379,12 +397,12 @@ class AgentsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(agent_id, "agent")
 
-            logger.info(f"Deleting agent with ID: {validated_id}")
+            logger.info("Deleting agent with ID: %s", validated_id)
             result = self.delete(f"/agents/{validated_id}")
 
-            logger.info(f"Successfully deleted agent: {validated_id}")
+            logger.info("Successfully deleted agent: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to delete agent {agent_id}: {str(e)}")
+            logger.error("Failed to delete agent %s: %s", agent_id, e)
             raise
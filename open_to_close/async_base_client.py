@@ -0,0 +1,304 @@
+"""Asynchronous base client for Open To Close API.
+
+Requires the optional ``httpx`` dependency::
+
+    pip install open-to-close[async]
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Union
+
+try:  # Optional dependency, see module docstring
+    import httpx
+except ImportError:  # pragma: no cover - depends on environment
+    httpx = None  # type: ignore[assignment]
+
+from .base_client import (
+    DEFAULT_TIMEOUT,
+    MAX_RETRIES,
+    RETRY_BACKOFF_FACTOR,
+    BaseClient,
+)
+from .exceptions import (
+    ConfigurationError,
+    NetworkError,
+    OpenToCloseAPIError,
+    RateLimitError,
+    ServerError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseClient(BaseClient):
+    """Asynchronous variant of the base client, backed by httpx.
+
+    Validation, response handling and the retry policy are inherited from
+    BaseClient; only the transport differs. Because requests are awaited
+    rather than blocking, callers can fan out many endpoint calls
+    concurrently and pay roughly the latency of the slowest one::
+
+        async with AsyncBaseClient() as client:
+            listings, fields = await asyncio.gather(
+                client.get("/properties"),
+                client.get("/propertyFields"),
+            )
+
+    The underlying connection pool is owned by this instance; close it
+    with aclose() or by using the client as an async context manager.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
+    ) -> None:
+        """Initialize the asynchronous base client.
+
+        Args:
+            api_key: API key for authentication
+            base_url: Base URL for the API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            retry_backoff_factor: Backoff factor for retries
+
+        Raises:
+            AuthenticationError: If API key is missing or invalid format
+            ConfigurationError: If configuration is invalid or httpx is
+                not installed
+        """
+        if httpx is None:
+            raise ConfigurationError(
+                "httpx is required for the async client. "
+                "Install it with: pip install open-to-close[async]"
+            )
+
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_backoff_factor=retry_backoff_factor,
+        )
+
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=self.timeout,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": "open-to-close-python-client/1.0.0",
+            },
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make an awaitable HTTP request with error handling and retries.
+
+        Mirrors BaseClient._request, but awaits the transport and sleeps
+        asynchronously between retry attempts so other tasks keep running.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Form data
+            json_data: JSON data
+            files: File uploads
+            params: Query parameters
+
+        Returns:
+            Response data
+
+        Raises:
+            Various OpenToCloseAPIError subclasses
+        """
+        endpoint = self._validate_endpoint(endpoint)
+        self._validate_request_data(json_data or data, endpoint)
+
+        base_url = self._get_base_url_for_operation(method, endpoint)
+        url = f"{base_url}/{endpoint.lstrip('/')}"
+
+        if params:
+            params = {**params, "api_token": self.api_key}
+        else:
+            params = {"api_token": self.api_key}
+
+        last_exception: Optional[Exception] = None
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    json=json_data,
+                    data=data,
+                    files=files,
+                    params=params,
+                )
+
+                return self._handle_response(response, endpoint, method)
+
+            except (httpx.TimeoutException, httpx.ConnectError) as e:
+                last_exception = NetworkError(
+                    f"Network error for {method} {endpoint}: {str(e)}",
+                    original_error=e,
+                    endpoint=endpoint,
+                    method=method,
+                )
+
+            except httpx.RequestError as e:
+                last_exception = NetworkError(
+                    f"Request error for {method} {endpoint}: {str(e)}",
+                    original_error=e,
+                    endpoint=endpoint,
+                    method=method,
+                )
+
+            except (RateLimitError, ServerError) as e:
+                last_exception = e
+
+            except Exception as e:
+                # Convert unexpected exceptions to our exception types
+                last_exception = OpenToCloseAPIError(
+                    f"Unexpected error for {method} {endpoint}: {str(e)}",
+                    endpoint=endpoint,
+                    method=method,
+                )
+
+            if not self._should_retry(last_exception, attempt):
+                break
+
+            if attempt < self.max_retries:
+                retry_after = getattr(last_exception, "retry_after", None)
+                delay = self._calculate_retry_delay(attempt, retry_after)
+
+                logger.warning(
+                    "Request failed, retrying in %.1fs (attempt %d/%d)",
+                    delay,
+                    attempt,
+                    self.max_retries,
+                    extra={
+                        "endpoint": endpoint,
+                        "method": method,
+                        "error": str(last_exception),
+                    },
+                )
+
+                await asyncio.sleep(delay)
+
+        if last_exception:
+            raise last_exception
+
+        raise OpenToCloseAPIError(f"Request failed for {method} {endpoint}")
+
+    async def get(  # type: ignore[override]
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make GET request with validation.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Response data
+        """
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(  # type: ignore[override]
+        self,
+        endpoint: str,
+        json_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make POST request with validation.
+
+        Args:
+            endpoint: API endpoint
+            json_data: JSON data to send
+            data: Form data to send
+            files: Files to upload
+
+        Returns:
+            Response data
+        """
+        return await self._request(
+            "POST", endpoint, json_data=json_data, data=data, files=files
+        )
+
+    async def put(  # type: ignore[override]
+        self,
+        endpoint: str,
+        json_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make PUT request with validation.
+
+        Args:
+            endpoint: API endpoint
+            json_data: JSON data to send
+            data: Form data to send
+            files: Files to upload
+
+        Returns:
+            Response data
+        """
+        return await self._request(
+            "PUT", endpoint, json_data=json_data, data=data, files=files
+        )
+
+    async def delete(self, endpoint: str) -> Dict[str, Any]:  # type: ignore[override]
+        """Make DELETE request with validation.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            Response data
+        """
+        return await self._request("DELETE", endpoint)
+
+    async def patch(  # type: ignore[override]
+        self,
+        endpoint: str,
+        json_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make PATCH request with validation.
+
+        Args:
+            endpoint: API endpoint
+            json_data: JSON data to send
+            data: Form data to send
+            files: Files to upload
+
+        Returns:
+            Response data
+        """
+        return await self._request(
+            "PATCH", endpoint, json_data=json_data, data=data, files=files
+        )
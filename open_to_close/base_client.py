@@ -1,13 +1,40 @@
 """Base client for Open To Close API."""
 
+import functools
+import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
+from urllib3.util.retry import Retry
+
+try:  # Optional accelerator (pip install open-to-close[speed])
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+try:  # Optional binary wire format (pip install open-to-close[speed])
+    import msgpack
+except ImportError:  # pragma: no cover - depends on environment
+    msgpack = None  # type: ignore[assignment]
 
 from .exceptions import (
     AuthenticationError,
@@ -22,22 +49,263 @@ from .exceptions import (
     ValidationError,
 )
 
-load_dotenv()
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Decorated-method type for cached_get, so decoration preserves signatures
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_once() -> None:
+    """Load .env variables, at most once per process.
+
+    load_dotenv() walks the filesystem looking for a .env file, so it is
+    deferred off the import path and only runs when a client actually needs
+    to resolve the API key from the environment.
+    """
+    load_dotenv()
+
+
 # Constants
 DEFAULT_BASE_URL = "https://api.opentoclose.com/v1"
 NON_V1_BASE_URL = "https://api.opentoclose.com"
 DEFAULT_TIMEOUT = 30.0
 MAX_RETRIES = 3
 RETRY_BACKOFF_FACTOR = 2.0
+POOL_MAXSIZE = 32
+CONNECT_RETRIES = 3
+
+# Translation table for building hyphenated option-name variants
+_SPACE_TO_HYPHEN = str.maketrans(" ", "-")
+
+# Accept header sent when msgpack negotiation is enabled; JSON stays as the
+# q=0.9 fallback for servers that only speak JSON
+_MSGPACK_ACCEPT_HEADERS = {"Accept": "application/msgpack, application/json;q=0.9"}
+
+# Process-wide session shared by all client instances so connections are
+# pooled and TLS handshakes are reused instead of re-established per client
+_shared_session: Optional[requests.Session] = None
+
+
+def _parse_json_content(response: requests.Response) -> Any:
+    """Parse a JSON response body, using orjson when available.
+
+    orjson decodes the raw bytes directly, skipping the charset detection
+    and pure-Python parsing that response.json() performs.
+
+    Args:
+        response: HTTP response to parse
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    content = response.content
+    if isinstance(content, (bytes, bytearray, str)):
+        if orjson is not None:
+            return orjson.loads(content)
+        # json.loads accepts bytes directly, so even the stdlib path skips
+        # the charset detection response.json() would run via response.text
+        return json.loads(content)
+    return response.json()
+
+
+def _get_shared_session() -> requests.Session:
+    """Get the shared requests session, creating it on first use.
+
+    Returns:
+        Session with default headers configured for the API
+    """
+    global _shared_session
+
+    if _shared_session is None:
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": "open-to-close-python-client/1.0.0",
+            }
+        )
+
+        # Retry connection-level failures (DNS, TCP connect, dropped
+        # keep-alive sockets) inside the pool, where the retry reuses the
+        # resolved address and warm TLS session. HTTP error statuses are
+        # deliberately excluded (empty status_forcelist): 429/5xx retries
+        # belong to _request's loop, which honors Retry-After and feeds
+        # the adaptive token bucket — retrying them here too would
+        # multiply the attempt counts. Read retries are limited to
+        # idempotent methods so a POST is never silently replayed.
+        retry = Retry(
+            total=CONNECT_RETRIES,
+            connect=CONNECT_RETRIES,
+            read=CONNECT_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(),
+            allowed_methods=frozenset({"GET", "PUT", "DELETE", "HEAD", "OPTIONS"}),
+        )
+
+        # Widen the connection pool beyond the urllib3 default of 10 so
+        # parallel requests (bulk/threaded helpers) keep their warm TLS
+        # connections instead of discarding the overflow after each burst
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        _shared_session = session
+
+    return _shared_session
+
+
+# Error-status dispatch table: status -> (exception class, message prefix,
+# default message). One dict probe replaces the if/elif chain walked on
+# every non-2xx response; 400 and 429 pick up extra context below.
+_STATUS_ERRORS = {
+    400: (ValidationError, "Bad request to", "Invalid request"),
+    401: (AuthenticationError, "Authentication failed for", "Invalid credentials"),
+    404: (NotFoundError, "Resource not found for", "Not found"),
+    429: (RateLimitError, "Rate limit exceeded for", "Too many requests"),
+}
+
+
+class _TokenBucket:
+    """Adaptive in-process token bucket for client-side request pacing.
+
+    acquire() blocks until a token is available, refilling at the current
+    rate. The rate adapts AIMD-style: decrease() halves it after a server
+    429 and increase() recovers it additively on success, so the client
+    converges on the server's sustainable throughput instead of bouncing
+    off the limit. Thread-safe, so the threaded bulk helpers can share one
+    bucket per client.
+    """
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        """Initialize the bucket.
+
+        Args:
+            capacity: Maximum burst size in tokens
+            rate: Refill rate in tokens (requests) per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._max_rate = rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one becomes available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.rate,
+                )
+                self._last_refill = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def decrease(self, alpha: float = 0.5) -> None:
+        """Multiplicatively back off the refill rate after a rate limit.
+
+        Args:
+            alpha: Multiplier applied to the current rate
+        """
+        with self._lock:
+            self.rate = max(self.rate * alpha, 0.1)
+
+    def increase(self, delta: float = 0.1) -> None:
+        """Additively recover the refill rate after a success.
+
+        Args:
+            delta: Tokens per second added back, capped at the initial rate
+        """
+        with self._lock:
+            self.rate = min(self.rate + delta, self._max_rate)
+
+
+def cached_get(ttl: float = 300.0) -> Callable[[_F], _F]:
+    """Cache a pure-GET method's result per client instance for ``ttl`` seconds.
+
+    Schema-style endpoints return data that effectively never changes within
+    a process lifetime; within the TTL a repeat call skips the network and
+    parse entirely and returns the stored result object. This complements
+    the ETag revalidation in get(): the TTL cache avoids even the
+    revalidation round-trip, and once it expires the next fetch usually
+    comes back as a cheap 304. Clear with BaseClient.invalidate_cache().
+
+    Args:
+        ttl: Seconds a cached result stays fresh
+
+    Returns:
+        Decorator for methods of BaseClient subclasses
+    """
+
+    def decorator(fn: _F) -> _F:
+        @functools.wraps(fn)
+        def wrapper(self: "BaseClient", *args: Any, **kwargs: Any) -> Any:
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = self._get_cache.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+            value = fn(self, *args, **kwargs)
+            self._get_cache[key] = (now, value)
+            return value
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+def _close_session(session: requests.Session) -> None:
+    """Close a session, discarding the shared one if that is what it is.
+
+    Resetting the module-level reference means the next client to ask for
+    the shared session gets a fresh, open one instead of the closed pool.
+
+    Args:
+        session: Session to close
+    """
+    global _shared_session
+
+    if session is _shared_session:
+        _shared_session = None
+    session.close()
 
 
 class BaseClient:
     """Base client with common functionality and enhanced error handling."""
 
+    # Fixed attribute layout: composite usage instantiates one client per
+    # service, so dropping the per-instance __dict__ saves memory and makes
+    # attribute access a fixed-offset load. Subclasses that add their own
+    # state simply omit __slots__ and get a __dict__ for the extras.
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "timeout",
+        "max_retries",
+        "retry_backoff_factor",
+        "session",
+        "_bucket",
+        "_field_mappings_cache",
+        "_field_mappings_raw",
+        "_etag_cache",
+        "_get_cache",
+        "_base_url_norm",
+        "_default_params",
+        "_accept_msgpack",
+        "_executor",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -45,6 +313,10 @@ class BaseClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
         retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        session: Optional[requests.Session] = None,
+        rate_limit_rps: Optional[float] = None,
+        accept_msgpack: bool = False,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the base client.
 
@@ -54,6 +326,21 @@ class BaseClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_backoff_factor: Backoff factor for retries
+            session: Requests session to use. When omitted, the process-wide
+                     pooled session is used so all clients share connections.
+            rate_limit_rps: Optional client-side request pacing in requests
+                            per second. When set, requests are throttled by
+                            an adaptive token bucket that backs off on 429s.
+            accept_msgpack: Advertise application/msgpack in the Accept
+                            header (with JSON fallback) and decode msgpack
+                            responses. Requires the optional msgpack
+                            dependency; off by default since not every
+                            server negotiates content types correctly.
+            executor: Thread pool used by get_many. When provided (e.g. by
+                      the composite client, which shares one pool across
+                      all services) the caller owns its lifecycle; when
+                      omitted, get_many creates a short-lived pool per
+                      call.
 
         Raises:
             AuthenticationError: If API key is missing or invalid format
@@ -63,12 +350,45 @@ class BaseClient:
         self._validate_and_set_configuration(
             base_url, timeout, max_retries, retry_backoff_factor
         )
-        self._setup_session()
+        self._setup_session(session)
+
+        # Optional preemptive throttle; None means no pacing overhead
+        self._bucket: Optional[_TokenBucket] = None
+        if rate_limit_rps is not None:
+            if not isinstance(rate_limit_rps, (int, float)) or rate_limit_rps <= 0:
+                raise ConfigurationError(
+                    f"Invalid rate_limit_rps: {rate_limit_rps}. "
+                    "Must be a positive number."
+                )
+            # Allow short bursts of up to two seconds' worth of requests
+            self._bucket = _TokenBucket(
+                capacity=max(1.0, float(rate_limit_rps) * 2),
+                rate=float(rate_limit_rps),
+            )
 
         # Initialize field mappings cache
         self._field_mappings_cache: Optional[Dict[str, Dict[str, Any]]] = None
         self._field_mappings_raw: Optional[List[Dict[str, Any]]] = None
 
+        # Conditional-GET cache: cache key -> (ETag, parsed body). A 304
+        # revalidation returns the stored body without any parsing work.
+        self._etag_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+        # TTL cache for @cached_get-decorated methods: (method, args) ->
+        # (monotonic timestamp, result)
+        self._get_cache: Dict[tuple, tuple] = {}
+
+        # Opt-in msgpack content negotiation; requires the optional decoder
+        if accept_msgpack and msgpack is None:
+            raise ConfigurationError(
+                "accept_msgpack requires the msgpack package. "
+                "Install it with: pip install open-to-close[speed]"
+            )
+        self._accept_msgpack = accept_msgpack
+
+        # Injected shared thread pool for get_many; its owner shuts it down
+        self._executor = executor
+
         logger.info(
             "Initialized Open To Close API client",
             extra={
@@ -87,6 +407,10 @@ class BaseClient:
         Raises:
             AuthenticationError: If API key is missing or invalid format
         """
+        if api_key is None:
+            # Only pay the .env file lookup when the key must come from the
+            # environment
+            _load_env_once()
         self.api_key = api_key or os.getenv("OPEN_TO_CLOSE_API_KEY")
 
         if not self.api_key:
@@ -99,6 +423,10 @@ class BaseClient:
         if not isinstance(self.api_key, str) or len(self.api_key.strip()) == 0:
             raise AuthenticationError("API key must be a non-empty string.")
 
+        # Default query parameters sent with every request, built once so
+        # the hot path only merges dicts instead of re-creating this one
+        self._default_params = {"api_token": self.api_key}
+
         # Log API key validation (without exposing the key)
         logger.debug("API key validated successfully")
 
@@ -129,6 +457,9 @@ class BaseClient:
                 f"Invalid base_url: {self.base_url}. Must be a valid HTTP/HTTPS URL."
             )
 
+        # Normalized prefix so building a request URL is one concatenation
+        self._base_url_norm = self.base_url.rstrip("/") + "/"
+
         # Validate timeout
         if not isinstance(timeout, (int, float)) or timeout <= 0:
             raise ConfigurationError(
@@ -153,16 +484,18 @@ class BaseClient:
             )
         self.retry_backoff_factor = float(retry_backoff_factor)
 
-    def _setup_session(self) -> None:
-        """Set up the requests session with proper configuration."""
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": "open-to-close-python-client/1.0.0",
-            }
-        )
+    def _setup_session(self, session: Optional[requests.Session] = None) -> None:
+        """Set up the requests session with proper configuration.
+
+        By default all client instances reuse one module-level session so
+        repeated requests share pooled connections rather than opening a new
+        TLS connection per client. Callers may inject their own session, e.g.
+        the composite client passing one session to every sub-client.
+
+        Args:
+            session: Session to use instead of the shared default
+        """
+        self.session = session if session is not None else _get_shared_session()
 
         # Session timeout is configured per request in the _request method
 
@@ -206,7 +539,7 @@ class BaseClient:
         # Normalize endpoint (ensure leading slash)
         normalized_endpoint = endpoint if endpoint.startswith("/") else f"/{endpoint}"
 
-        logger.debug(f"Validated endpoint: {normalized_endpoint}")
+        logger.debug("Validated endpoint: %s", normalized_endpoint)
         return normalized_endpoint
 
     def _validate_resource_id(
@@ -264,7 +597,8 @@ class BaseClient:
             data_size = 0
 
         logger.debug(
-            f"Request data validated for endpoint: {endpoint}",
+            "Request data validated for endpoint: %s",
+            endpoint,
             extra={"data_type": type(data).__name__, "data_size": data_size},
         )
 
@@ -331,10 +665,24 @@ class BaseClient:
         """
         # Parse response data safely
         try:
-            response_data = response.json() if response.content else {}
+            if not response.content:
+                response_data: Any = {}
+            elif msgpack is not None and "msgpack" in response.headers.get(
+                "content-type", ""
+            ):
+                response_data = msgpack.unpackb(response.content, raw=False)
+            else:
+                response_data = _parse_json_content(response)
         except ValueError as e:
-            logger.warning(f"Failed to parse JSON response: {e}")
-            response_data = {"message": response.text, "raw_content": response.text}
+            logger.warning("Failed to parse JSON response: %s", e)
+            # JSON bodies are UTF-8 by RFC; decode the bytes directly
+            # instead of going through response.text's charset detection
+            content = response.content
+            if isinstance(content, (bytes, bytearray)):
+                text = content.decode("utf-8", "replace")
+            else:
+                text = response.text
+            response_data = {"message": text, "raw_content": text}
 
         # Log response for debugging
         try:
@@ -346,16 +694,20 @@ class BaseClient:
         except (TypeError, AttributeError):
             response_size = 0
 
+        status: int = response.status_code
+
         logger.debug(
-            f"Received response from {method} {endpoint}",
+            "Received response from %s %s",
+            method,
+            endpoint,
             extra={
-                "status_code": getattr(response, "status_code", 0),
+                "status_code": status,
                 "response_size": response_size,
             },
         )
 
         # Handle successful responses
-        if response.status_code in (200, 201):
+        if status in (200, 201):
             # Check if we got HTML instead of JSON (indicates auth redirect or server error)
             content_type = response.headers.get("content-type", "").lower()
             if "text/html" in content_type:
@@ -366,7 +718,7 @@ class BaseClient:
                 ):
                     raise ServerError(
                         f"Server returned HTML error page for {method} {endpoint}. The endpoint may not be available or implemented.",
-                        status_code=response.status_code,
+                        status_code=status,
                         response_data={
                             "message": "Server error returned as HTML",
                             "content_type": content_type,
@@ -377,7 +729,7 @@ class BaseClient:
                 else:
                     raise AuthenticationError(
                         f"Received HTML login page instead of JSON for {method} {endpoint}. Check authentication or endpoint availability.",
-                        status_code=response.status_code,
+                        status_code=status,
                         response_data={
                             "message": "Authentication required",
                             "content_type": content_type,
@@ -385,64 +737,48 @@ class BaseClient:
                         endpoint=endpoint,
                         method=method,
                     )
-            return response_data
-        if response.status_code == 204:
+            # The parsed body is Any; the declared dict contract is what
+            # callers (and _process_*_response) rely on
+            return cast(Dict[str, Any], response_data)
+        if status == 204:
             return {}
 
         # Enhanced error handling with context
-        error_kwargs = {
-            "status_code": response.status_code,
+        error_kwargs: Dict[str, Any] = {
+            "status_code": status,
             "response_data": response_data,
             "endpoint": endpoint,
             "method": method,
         }
 
-        if response.status_code == 400:
-            # Extract field-specific errors if available
-            field_errors = None
-            if isinstance(response_data, dict):
-                field_errors = response_data.get("errors") or response_data.get(
-                    "field_errors"
-                )
-
-            raise ValidationError(
-                f"Bad request to {method} {endpoint}: {response_data.get('message', 'Invalid request')}",
-                field_errors=field_errors,
-                **error_kwargs,
-            )
-
-        elif response.status_code == 401:
-            message = response_data.get("message", "Invalid credentials")
-            raise AuthenticationError(
-                f"Authentication failed for {method} {endpoint}: {message}",
-                **error_kwargs,
-            )
-
-        elif response.status_code == 404:
-            raise NotFoundError(
-                f"Resource not found for {method} {endpoint}: {response_data.get('message', 'Not found')}",
-                status_code=response.status_code,
-                response_data=response_data,
-                endpoint=endpoint,
-                method=method,
-            )
-
-        elif response.status_code == 429:
-            message = response_data.get("message", "Too many requests")
-            retry_after = None
-            if "retry-after" in response.headers:
-                try:
-                    retry_after = int(response.headers["retry-after"])
-                except ValueError:
-                    pass
-
-            raise RateLimitError(
-                f"Rate limit exceeded for {method} {endpoint}: {message}",
-                retry_after=retry_after,
+        entry = _STATUS_ERRORS.get(status)
+        if entry is not None:
+            exception_class, prefix, default_message = entry
+            message = response_data.get("message", default_message)
+
+            if status == 400:
+                # Extract field-specific errors if available
+                field_errors = None
+                if isinstance(response_data, dict):
+                    field_errors = response_data.get("errors") or response_data.get(
+                        "field_errors"
+                    )
+                error_kwargs["field_errors"] = field_errors
+            elif status == 429:
+                retry_after = None
+                if "retry-after" in response.headers:
+                    try:
+                        retry_after = int(response.headers["retry-after"])
+                    except ValueError:
+                        pass
+                error_kwargs["retry_after"] = retry_after
+
+            raise exception_class(
+                f"{prefix} {method} {endpoint}: {message}",
                 **error_kwargs,
             )
 
-        elif 500 <= response.status_code < 600:
+        if 500 <= status < 600:
             message = response_data.get("message", "Internal server error")
             raise ServerError(
                 f"Server error for {method} {endpoint}: {message}",
@@ -452,10 +788,7 @@ class BaseClient:
         # Generic error for other status codes
         raise OpenToCloseAPIError(
             f"Unexpected error for {method} {endpoint}: {response_data.get('message', 'Unknown error')}",
-            status_code=response.status_code,
-            response_data=response_data,
-            endpoint=endpoint,
-            method=method,
+            **error_kwargs,
         )
 
     def _process_response_data(
@@ -491,7 +824,7 @@ class BaseClient:
             if isinstance(data, dict):
                 return data
             else:
-                logger.warning(f"Unexpected data format in response from {endpoint}")
+                logger.warning("Unexpected data format in response from %s", endpoint)
                 return {}
 
         # Return response as-is if it's a valid dict
@@ -524,7 +857,9 @@ class BaseClient:
                     return data
                 else:
                     logger.warning(
-                        f"Expected list in data field from {endpoint}, got {type(data).__name__}"
+                        "Expected list in data field from %s, got %s",
+                        endpoint,
+                        type(data).__name__,
                     )
                     return []
 
@@ -574,14 +909,13 @@ class BaseClient:
         endpoint = self._validate_endpoint(endpoint)
         self._validate_request_data(json_data or data, endpoint)
 
-        # Get the appropriate base URL for this operation
-        base_url = self._get_base_url_for_operation(method, endpoint)
-        url = f"{base_url}/{endpoint.lstrip('/')}"
+        url: str = self._base_url_norm + endpoint.lstrip("/")
 
-        # Add api_token to params for all requests
-        if params is None:
-            params = {}
-        params["api_token"] = self.api_key
+        # Add api_token to params for all requests. Merge into a fresh dict
+        # so the caller's dictionary is never mutated; with no caller params
+        # the prebuilt default dict is passed as-is (requests never mutates
+        # it).
+        params = {**self._default_params, **params} if params else self._default_params
 
         # Log request details
         try:
@@ -590,7 +924,9 @@ class BaseClient:
             params_count = 0
 
         logger.info(
-            f"Making {method} request to {endpoint}",
+            "Making %s request to %s",
+            method,
+            endpoint,
             extra={
                 "url": url,
                 "has_json_data": json_data is not None,
@@ -601,10 +937,14 @@ class BaseClient:
         )
 
         # Retry logic
+        bucket = self._bucket
         last_exception: Optional[Exception] = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = self.session.request(
+                if bucket is not None:
+                    bucket.acquire()
+
+                request_kwargs: Dict[str, Any] = dict(
                     method=method,
                     url=url,
                     json=json_data,
@@ -613,8 +953,14 @@ class BaseClient:
                     params=params,
                     timeout=self.timeout,
                 )
+                if self._accept_msgpack:
+                    request_kwargs["headers"] = _MSGPACK_ACCEPT_HEADERS
+                response = self.session.request(**request_kwargs)
 
-                return self._handle_response(response, endpoint, method)
+                result = self._handle_response(response, endpoint, method)
+                if bucket is not None:
+                    bucket.increase()
+                return result
 
             except (ConnectionError, Timeout) as e:
                 last_exception = NetworkError(
@@ -633,6 +979,10 @@ class BaseClient:
                 )
 
             except (RateLimitError, ServerError) as e:
+                if bucket is not None and isinstance(e, RateLimitError):
+                    # The server pushed back: halve the local rate so the
+                    # retry (and subsequent calls) stay under the quota
+                    bucket.decrease()
                 last_exception = e
 
             except Exception as e:
@@ -653,7 +1003,10 @@ class BaseClient:
                 delay = self._calculate_retry_delay(attempt, retry_after)
 
                 logger.warning(
-                    f"Request failed, retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries})",
+                    "Request failed, retrying in %.1fs (attempt %s/%s)",
+                    delay,
+                    attempt,
+                    self.max_retries,
                     extra={
                         "endpoint": endpoint,
                         "method": method,
@@ -673,19 +1026,196 @@ class BaseClient:
         raise OpenToCloseAPIError(f"Request failed for {method} {endpoint}")
 
     def get(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        etag_cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Make GET request with validation.
 
         Args:
             endpoint: API endpoint
             params: Query parameters
+            etag_cache_key: When set, responses are cached under this key
+                            and revalidated with If-None-Match; a 304 reply
+                            returns the cached body without reparsing.
 
         Returns:
             Response data
         """
+        if etag_cache_key is not None:
+            return self._conditional_get(endpoint, etag_cache_key, params=params)
         return self._request("GET", endpoint, params=params)
 
+    def get_many(
+        self,
+        endpoints: List[str],
+        params_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_workers: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Make several GET requests concurrently over the shared session.
+
+        Network-bound fetches release the GIL while waiting, so a small
+        thread pool turns N sequential round-trips into roughly the latency
+        of the slowest one. The session's connection pool is sized well
+        above the default worker count, so parallel requests reuse warm
+        connections instead of serializing on the pool. When client-side
+        pacing is enabled (rate_limit_rps), the shared token bucket still
+        throttles the aggregate request rate across workers.
+
+        Args:
+            endpoints: API endpoints to fetch
+            params_list: Optional per-endpoint query parameters, matched by
+                         position; None entries mean no parameters
+            max_workers: Maximum number of concurrent requests; ignored
+                         when a shared executor was injected at
+                         construction, whose own worker bound applies
+
+        Returns:
+            Response data for each endpoint, in input order
+
+        Raises:
+            ValidationError: If params_list length does not match endpoints
+            Various OpenToCloseAPIError subclasses from individual requests
+        """
+        if params_list is None:
+            params_list = [None] * len(endpoints)
+        elif len(params_list) != len(endpoints):
+            raise ValidationError(
+                f"params_list length ({len(params_list)}) must match "
+                f"endpoints length ({len(endpoints)})"
+            )
+
+        if not endpoints:
+            return []
+
+        # Prefer the injected shared pool: its threads already exist, and
+        # one pool across all services keeps the total worker count aligned
+        # with the connection pool instead of multiplying per client
+        executor = self._executor
+        if executor is not None:
+            return list(executor.map(self.get, endpoints, params_list))
+
+        workers = min(max_workers, len(endpoints))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get, endpoints, params_list))
+
+    def iter_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over a list endpoint page by page, yielding items lazily.
+
+        Pages are fetched with limit/offset parameters as the caller
+        consumes items, so peak memory stays proportional to one page
+        rather than the full collection, and a caller that stops early
+        (e.g. after finding the first match) never pays for the remaining
+        pages. Iteration ends when the server returns a short or empty
+        page.
+
+        Args:
+            endpoint: API endpoint returning a list
+            params: Optional query parameters applied to every page; any
+                    limit/offset entries are overridden by the paging loop
+            page_size: Number of items requested per page
+
+        Yields:
+            Individual item dictionaries in server order
+
+        Raises:
+            ValidationError: If page_size is not a positive integer
+            Various OpenToCloseAPIError subclasses from page requests
+        """
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise ValidationError(
+                f"page_size must be a positive integer, got {page_size}"
+            )
+
+        offset = 0
+        while True:
+            page_params = dict(params) if params else {}
+            page_params["limit"] = page_size
+            page_params["offset"] = offset
+
+            response = self.get(endpoint, params=page_params)
+            page = self._process_list_response(response, endpoint)
+
+            yield from page
+
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def _conditional_get(
+        self,
+        endpoint: str,
+        cache_key: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make a conditional GET, serving unchanged bodies from cache.
+
+        Sends If-None-Match with the stored ETag when one is known; on a
+        304 the server sends no body and the previously parsed result is
+        returned as-is, skipping both transfer and parse. Like
+        _request_stream this issues a single attempt without the retry
+        loop — callers of schema-style endpoints retry at their own pace.
+
+        Args:
+            endpoint: API endpoint
+            cache_key: Key under which the ETag and parsed body are stored
+            params: Query parameters
+
+        Returns:
+            Response data (possibly the cached copy)
+
+        Raises:
+            NetworkError: If the request fails at the transport level
+            Various OpenToCloseAPIError subclasses for error statuses
+        """
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+        endpoint = self._validate_endpoint(endpoint)
+        url = self._base_url_norm + endpoint.lstrip("/")
+        params = {**self._default_params, **params} if params else self._default_params
+
+        try:
+            response = self.session.request(
+                "GET",
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except (ConnectionError, Timeout) as e:
+            raise NetworkError(
+                f"Network error for GET {endpoint}: {str(e)}",
+                original_error=e,
+                endpoint=endpoint,
+                method="GET",
+            )
+        except RequestException as e:
+            raise NetworkError(
+                f"Request error for GET {endpoint}: {str(e)}",
+                original_error=e,
+                endpoint=endpoint,
+                method="GET",
+            )
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug("Serving %s from ETag cache", endpoint)
+            return cached[1]
+
+        result = self._handle_response(response, endpoint, "GET")
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, result)
+
+        return result
+
     def post(
         self,
         endpoint: str,
@@ -763,6 +1293,62 @@ class BaseClient:
             "PATCH", endpoint, json_data=json_data, data=data, files=files
         )
 
+    def _request_stream(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """Make a streaming GET request, leaving the body unconsumed.
+
+        The returned response was opened with stream=True; callers parse
+        response.raw incrementally (and should close the response when
+        done). Unlike _request there is no retry loop — streaming callers
+        cannot transparently replay a half-consumed body.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Open streaming response with a 2xx status
+
+        Raises:
+            NetworkError: If the request fails at the transport level
+            Various OpenToCloseAPIError subclasses for error statuses
+        """
+        endpoint = self._validate_endpoint(endpoint)
+        url = self._base_url_norm + endpoint.lstrip("/")
+        params = {**self._default_params, **params} if params else self._default_params
+
+        try:
+            response = self.session.request(
+                "GET", url, params=params, timeout=self.timeout, stream=True
+            )
+        except (ConnectionError, Timeout) as e:
+            raise NetworkError(
+                f"Network error for GET {endpoint}: {str(e)}",
+                original_error=e,
+                endpoint=endpoint,
+                method="GET",
+            )
+        except RequestException as e:
+            raise NetworkError(
+                f"Request error for GET {endpoint}: {str(e)}",
+                original_error=e,
+                endpoint=endpoint,
+                method="GET",
+            )
+
+        if response.status_code >= 400:
+            # Error bodies are small, so route them through the standard
+            # handler to raise the appropriate exception type
+            self._handle_response(response, endpoint, "GET")
+
+        # requests leaves the urllib3 response with decode_content=False;
+        # without this, a gzip/br-encoded body would reach callers reading
+        # response.raw as compressed bytes instead of JSON
+        response.raw.decode_content = True
+
+        return response
+
     def get_field_mappings(
         self, force_refresh: bool = False
     ) -> Dict[str, Dict[str, Any]]:
@@ -829,25 +1415,42 @@ class BaseClient:
                                 # Handle various formats
                                 mapping["options"][option_title] = option.get("id")
                                 # Also map with hyphens instead of spaces
-                                mapping["options"][option_title.replace(" ", "-")] = (
-                                    option.get("id")
-                                )
+                                mapping["options"][
+                                    option_title.translate(_SPACE_TO_HYPHEN)
+                                ] = option.get("id")
                                 # Remove "listing-" prefix variations
                                 if option_title.startswith("listing-"):
                                     clean_title = option_title[8:]  # Remove "listing-"
                                     mapping["options"][clean_title] = option.get("id")
 
+                            # Single-probe lookup table: every stored variant
+                            # plus its space-normalized form, so option
+                            # resolution at create time is a couple of dict
+                            # gets instead of a scan over all options
+                            normalized = dict(mapping["options"])
+                            for opt_key, opt_id in mapping["options"].items():
+                                normalized.setdefault(opt_key.replace("-", " "), opt_id)
+                            mapping["_normalized_options"] = normalized
+
                         field_mappings[field_key] = mapping
 
             self._field_mappings_cache = field_mappings
-            logger.info(f"Successfully cached {len(field_mappings)} field mappings")
+            logger.info("Successfully cached %d field mappings", len(field_mappings))
 
             return field_mappings
 
         except Exception as e:
-            logger.error(f"Failed to fetch field mappings: {str(e)}")
+            logger.error("Failed to fetch field mappings: %s", e)
             raise
 
+    def invalidate_cache(self) -> None:
+        """Clear all results stored by @cached_get-decorated methods.
+
+        The next call to each decorated method refetches from the API
+        (typically answered with a 304 when an ETag is still cached).
+        """
+        self._get_cache.clear()
+
     def refresh_field_mappings(self) -> Dict[str, Dict[str, Any]]:
         """Force refresh of field mappings cache.
 
@@ -1,17 +1,137 @@
-from typing import Any, Dict, List, Optional, Tuple
-
-from .agents import AgentsAPI
-from .base_client import DEFAULT_BASE_URL
-from .contacts import ContactsAPI
-from .properties import PropertiesAPI
-from .property_contacts import PropertyContactsAPI
-from .property_documents import PropertyDocumentsAPI
-from .property_emails import PropertyEmailsAPI
-from .property_notes import PropertyNotesAPI
-from .property_tasks import PropertyTasksAPI
-from .tags import TagsAPI
-from .teams import TeamsAPI
-from .users import UsersAPI
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib import import_module
+
+import requests
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .base_client import (
+    BaseClient,
+    DEFAULT_BASE_URL,
+    POOL_MAXSIZE,
+    _close_session,
+    _get_shared_session,
+    _load_env_once,
+)
+
+if TYPE_CHECKING:
+    from .agents import AgentsAPI
+    from .contacts import ContactsAPI
+    from .properties import PropertiesAPI
+    from .property_contacts import PropertyContactsAPI
+    from .property_documents import PropertyDocumentsAPI
+    from .property_emails import PropertyEmailsAPI
+    from .property_notes import PropertyNotesAPI
+    from .property_tasks import PropertyTasksAPI
+    from .tags import TagsAPI
+    from .teams import TeamsAPI
+    from .users import UsersAPI
+
+# How long cached field mappings stay fresh before the next helper call
+# transparently refetches them, in seconds
+_FIELD_MAPPINGS_TTL = 300.0
+
+# Required property fields and the simple-format aliases that satisfy them
+REQUIRED_FIELD_ALIASES = {
+    "contract_title": ("title", "contract_title"),
+    "contract_client_type": ("client_type", "contract_client_type"),
+    "contract_status": ("status", "contract_status"),
+}
+
+# Inverted alias lookup built once at import, so resolving a payload key to
+# its canonical field is a single dict probe instead of a nested scan
+_ALIAS_TO_FIELD = {
+    alias: field_key
+    for field_key, aliases in REQUIRED_FIELD_ALIASES.items()
+    for alias in aliases
+}
+
+
+def _display_options(mapping: Dict[str, Any]) -> Tuple[str, ...]:
+    """Get the sorted display option names for a choice field mapping.
+
+    The option dict stores hyphenated lookup variants alongside the real
+    names; filtering and sorting them is O(options log options), so the
+    result is computed once and cached on the mapping itself. Mappings are
+    rebuilt on refresh, which naturally discards the cached tuple.
+
+    Args:
+        mapping: Field mapping dictionary containing an "options" dict
+
+    Returns:
+        Sorted tuple of display option names
+    """
+    cached = mapping.get("_display_options")
+    if cached is None:
+        cached = tuple(
+            sorted(
+                {
+                    option
+                    for option in mapping["options"]
+                    if "-" not in option or option.startswith("listing")
+                }
+            )
+        )
+        mapping["_display_options"] = cached
+    return cached
+
+
+_ServiceT = TypeVar("_ServiceT", bound=BaseClient)
+
+
+class _LazyService(Generic[_ServiceT]):
+    """Descriptor providing lazy, cached access to a service client.
+
+    Each service accessor used to be an identical five-line property block.
+    This descriptor implements the pattern once: on first access the service
+    module is imported, the service class constructed with the composite
+    client's credentials, shared session and thread pool, and the instance
+    cached so subsequent accesses are a single attribute read. Deferring the import
+    itself means unused service modules are never parsed at all.
+    """
+
+    __slots__ = ("module_name", "class_name", "attr", "_service_cls")
+
+    def __init__(self, module_name: str, class_name: str) -> None:
+        self.module_name = module_name
+        self.class_name = class_name
+        self._service_cls: Optional[Type[_ServiceT]] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = f"_{name}"
+
+    def __get__(
+        self, obj: Optional["OpenToCloseAPI"], objtype: Optional[type] = None
+    ) -> _ServiceT:
+        if obj is None:
+            # Class-level access (introspection, dir(), documentation tools)
+            return self  # type: ignore[return-value]
+        service: Optional[_ServiceT] = getattr(obj, self.attr)
+        if service is None:
+            service_cls = self._service_cls
+            if service_cls is None:
+                module = import_module(self.module_name, __package__)
+                service_cls = getattr(module, self.class_name)
+                self._service_cls = service_cls
+            service = service_cls(
+                api_key=obj._api_key,
+                base_url=obj._base_url,
+                session=obj._session,
+                executor=obj._executor,
+            )
+            setattr(obj, self.attr, service)
+        return service
 
 
 class OpenToCloseAPI:
@@ -42,8 +162,39 @@ class OpenToCloseAPI:
         ```
     """
 
+    # Fixed attribute set: avoids a per-instance __dict__, which trims
+    # memory and speeds attribute access for multi-tenant setups that
+    # construct many clients
+    __slots__ = (
+        "_api_key",
+        "_base_url",
+        "_session",
+        "_executor",
+        "_agents",
+        "_contacts",
+        "_properties",
+        "_property_contacts",
+        "_property_documents",
+        "_property_emails",
+        "_property_notes",
+        "_property_tasks",
+        "_tags",
+        "_teams",
+        "_users",
+        "_validation_schema",
+        "_validation_schema_source",
+        "_field_mappings_fetched_at",
+        "_prefetch_future",
+        "_available_fields_cache",
+        "_available_fields_source",
+    )
+
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        prefetch_fields: bool = False,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the client.
 
@@ -53,13 +204,42 @@ class OpenToCloseAPI:
                      variable.
             base_url: Base URL for the Open To Close API. Defaults to
                       https://api.opentoclose.com/v1
+            prefetch_fields: If True, fetch field mappings in a background
+                             thread during construction so the first call to
+                             validate_property_data or list_available_fields
+                             does not block on the network round-trip.
+            session: Requests session handed to every sub-client, e.g. one
+                     with custom adapters or proxies. Defaults to the
+                     process-wide pooled session.
 
         Raises:
             AuthenticationError: If API key is not provided and not found in environment
         """
+        # Resolve the API key from the environment once here, so the 11
+        # lazily built sub-clients receive the resolved value instead of
+        # each re-reading the environment. A missing key is not an error
+        # yet: validation stays in BaseClient.__init__, so it surfaces as
+        # AuthenticationError on first service access, as before.
+        if api_key is None:
+            _load_env_once()
+            api_key = os.getenv("OPEN_TO_CLOSE_API_KEY")
         self._api_key = api_key
         self._base_url = base_url or DEFAULT_BASE_URL
 
+        # One pooled session handed to every sub-client, so requests to any
+        # service reuse the same keep-alive connections instead of paying a
+        # fresh TCP+TLS handshake per service
+        self._session = session if session is not None else _get_shared_session()
+
+        # One thread pool shared by every sub-client's bulk helpers (and
+        # the optional prefetch below). Constructing the pool object is
+        # cheap — worker threads are only spawned as tasks are submitted —
+        # and bounding it to the connection pool size means workers never
+        # queue on connections
+        self._executor = ThreadPoolExecutor(
+            max_workers=POOL_MAXSIZE, thread_name_prefix="open-to-close"
+        )
+
         # Lazy initialization of service clients
         self._agents: Optional[AgentsAPI] = None
         self._contacts: Optional[ContactsAPI] = None
@@ -73,138 +253,69 @@ class OpenToCloseAPI:
         self._teams: Optional[TeamsAPI] = None
         self._users: Optional[UsersAPI] = None
 
-    @property
-    def agents(self) -> AgentsAPI:
-        """Access to agents endpoints.
-
-        Returns:
-            AgentsAPI instance for managing agents
-        """
-        if self._agents is None:
-            self._agents = AgentsAPI(api_key=self._api_key, base_url=self._base_url)
-        return self._agents
-
-    @property
-    def contacts(self) -> ContactsAPI:
-        """Access to contacts endpoints.
-
-        Returns:
-            ContactsAPI instance for managing contacts
-        """
-        if self._contacts is None:
-            self._contacts = ContactsAPI(api_key=self._api_key, base_url=self._base_url)
-        return self._contacts
-
-    @property
-    def properties(self) -> PropertiesAPI:
-        """Access to properties endpoints.
-
-        Returns:
-            PropertiesAPI instance for managing properties
-        """
-        if self._properties is None:
-            self._properties = PropertiesAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
-        return self._properties
-
-    @property
-    def property_contacts(self) -> PropertyContactsAPI:
-        """Access to property contacts endpoints.
-
-        Returns:
-            PropertyContactsAPI instance for managing property contacts
-        """
-        if self._property_contacts is None:
-            self._property_contacts = PropertyContactsAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
-        return self._property_contacts
-
-    @property
-    def property_documents(self) -> PropertyDocumentsAPI:
-        """Access to property documents endpoints.
-
-        Returns:
-            PropertyDocumentsAPI instance for managing property documents
-        """
-        if self._property_documents is None:
-            self._property_documents = PropertyDocumentsAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
-        return self._property_documents
-
-    @property
-    def property_emails(self) -> PropertyEmailsAPI:
-        """Access to property emails endpoints.
-
-        Returns:
-            PropertyEmailsAPI instance for managing property emails
-        """
-        if self._property_emails is None:
-            self._property_emails = PropertyEmailsAPI(
-                api_key=self._api_key, base_url=self._base_url
+        # Compiled validation schema, rebuilt only when field mappings change
+        self._validation_schema: Optional[Dict[str, Any]] = None
+        self._validation_schema_source: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Sorted field listing, likewise rebuilt only when mappings change
+        self._available_fields_cache: Optional[List[Dict[str, Any]]] = None
+        self._available_fields_source: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Monotonic timestamp of the last field-mappings fetch, used to bound
+        # how stale the cached mappings may get before a transparent refresh
+        self._field_mappings_fetched_at: Optional[float] = None
+
+        # Optionally warm the field-mappings cache in the background on the
+        # shared pool. The client construction and fetch both run inside
+        # the worker thread, so a missing API key or network failure
+        # surfaces when the result is first consumed, not here.
+        self._prefetch_future: Optional["Future[Dict[str, Dict[str, Any]]]"] = None
+        if prefetch_fields:
+            self._prefetch_future = self._executor.submit(
+                lambda: self.properties.get_field_mappings()
             )
-        return self._property_emails
-
-    @property
-    def property_notes(self) -> PropertyNotesAPI:
-        """Access to property notes endpoints.
 
-        Returns:
-            PropertyNotesAPI instance for managing property notes
+    # Service accessors: modules imported and clients constructed lazily on
+    # first access, then cached on the instance (see _LazyService)
+    agents: "_LazyService[AgentsAPI]" = _LazyService(".agents", "AgentsAPI")
+    contacts: "_LazyService[ContactsAPI]" = _LazyService(".contacts", "ContactsAPI")
+    properties: "_LazyService[PropertiesAPI]" = _LazyService(
+        ".properties", "PropertiesAPI"
+    )
+    property_contacts: "_LazyService[PropertyContactsAPI]" = _LazyService(
+        ".property_contacts", "PropertyContactsAPI"
+    )
+    property_documents: "_LazyService[PropertyDocumentsAPI]" = _LazyService(
+        ".property_documents", "PropertyDocumentsAPI"
+    )
+    property_emails: "_LazyService[PropertyEmailsAPI]" = _LazyService(
+        ".property_emails", "PropertyEmailsAPI"
+    )
+    property_notes: "_LazyService[PropertyNotesAPI]" = _LazyService(
+        ".property_notes", "PropertyNotesAPI"
+    )
+    property_tasks: "_LazyService[PropertyTasksAPI]" = _LazyService(
+        ".property_tasks", "PropertyTasksAPI"
+    )
+    tags: "_LazyService[TagsAPI]" = _LazyService(".tags", "TagsAPI")
+    teams: "_LazyService[TeamsAPI]" = _LazyService(".teams", "TeamsAPI")
+    users: "_LazyService[UsersAPI]" = _LazyService(".users", "UsersAPI")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and shared thread pool.
+
+        The client and its service accessors must not be used afterwards.
+        If the session is the process-wide shared one it is also discarded,
+        so the next client constructed gets a fresh pool.
         """
-        if self._property_notes is None:
-            self._property_notes = PropertyNotesAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
-        return self._property_notes
+        self._executor.shutdown(wait=False)
+        _close_session(self._session)
 
-    @property
-    def property_tasks(self) -> PropertyTasksAPI:
-        """Access to property tasks endpoints.
+    def __enter__(self) -> "OpenToCloseAPI":
+        return self
 
-        Returns:
-            PropertyTasksAPI instance for managing property tasks
-        """
-        if self._property_tasks is None:
-            self._property_tasks = PropertyTasksAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
-        return self._property_tasks
-
-    @property
-    def tags(self) -> TagsAPI:
-        """Access to tags endpoints.
-
-        Returns:
-            TagsAPI instance for managing tags
-        """
-        if self._tags is None:
-            self._tags = TagsAPI(api_key=self._api_key, base_url=self._base_url)
-        return self._tags
-
-    @property
-    def teams(self) -> TeamsAPI:
-        """Access to teams endpoints.
-
-        Returns:
-            TeamsAPI instance for managing teams
-        """
-        if self._teams is None:
-            self._teams = TeamsAPI(api_key=self._api_key, base_url=self._base_url)
-        return self._teams
-
-    @property
-    def users(self) -> UsersAPI:
-        """Access to users endpoints.
-
-        Returns:
-            UsersAPI instance for managing users
-        """
-        if self._users is None:
-            self._users = UsersAPI(api_key=self._api_key, base_url=self._base_url)
-        return self._users
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
 
     def get_property_fields(self) -> List[Dict[str, Any]]:
         """Convenience method to retrieve property field definitions.
@@ -267,7 +378,16 @@ class OpenToCloseAPI:
                     print(f"  Options: {', '.join(field['options'])}")
             ```
         """
-        mappings = self.properties.get_field_mappings()
+        mappings = self._get_cached_mappings()
+
+        # The listing is fully determined by the mappings, so reuse the
+        # previously built result until they are refreshed
+        if (
+            self._available_fields_cache is not None
+            and self._available_fields_source is mappings
+        ):
+            return self._available_fields_cache
+
         required_fields = ["contract_title", "contract_client_type", "contract_status"]
 
         fields = []
@@ -280,20 +400,19 @@ class OpenToCloseAPI:
                 "required": field_key in required_fields,
             }
 
-            # For choice fields, extract option names
+            # For choice fields, extract option names (excluding the
+            # hyphenated lookup variations)
             if "options" in mapping:
-                # Get unique option names (excluding variations with hyphens)
-                option_names = [
-                    k
-                    for k in mapping["options"].keys()
-                    if "-" not in k or k.startswith("listing")
-                ]
-                field_info["options"] = sorted(set(option_names))
+                field_info["options"] = list(_display_options(mapping))
 
             fields.append(field_info)
 
         # Sort by required first, then by name
-        return sorted(fields, key=lambda x: (not x["required"], x["name"]))
+        fields.sort(key=lambda x: (not x["required"], x["name"]))
+
+        self._available_fields_cache = fields
+        self._available_fields_source = mappings
+        return fields
 
     def validate_property_data(
         self, property_data: Dict[str, Any]
@@ -324,64 +443,120 @@ class OpenToCloseAPI:
                 property = client.properties.create_property(property_data)
             ```
         """
-        errors = []
-        mappings = self.properties.get_field_mappings()
-
-        # Required fields
-        required_fields = {
-            "contract_title": ["title", "contract_title"],
-            "contract_client_type": ["client_type", "contract_client_type"],
-            "contract_status": ["status", "contract_status"],
-        }
+        errors: List[str] = []
+        schema = self._get_validation_schema()
+        mappings = schema["mappings"]
+
+        # Bind the per-key operations to locals; validation runs once per
+        # record in bulk workflows, so the loop body should be bare dict
+        # probes rather than repeated attribute lookups
+        errors_append = errors.append
+        alias_get = schema["alias_to_field"].get
+        choice_get = schema["choice_options"].get
+        data_get = property_data.get
 
         # Check required fields
-        for field_key, aliases in required_fields.items():
-            found = False
-            for alias in aliases:
-                if alias in property_data and property_data[alias]:
-                    found = True
-                    break
-            if not found:
-                errors.append(
+        for field_key, aliases in REQUIRED_FIELD_ALIASES.items():
+            if not any(data_get(alias) for alias in aliases):
+                errors_append(
                     f"Missing required field: {field_key} (use any of: {', '.join(aliases)})"
                 )
 
         # Validate field values
         for key, value in property_data.items():
-            # Check if field exists in mappings
+            # Resolve aliases to their canonical field key
             if key not in mappings:
-                # Check if it's an alias for a required field
-                is_alias = False
-                for field_key, aliases in required_fields.items():
-                    if key in aliases:
-                        is_alias = True
-                        # Use the actual field key for validation
-                        key = field_key
-                        break
-
-                if not is_alias:
-                    errors.append(f"Unknown field: {key}")
+                canonical_key = alias_get(key)
+                if canonical_key is None:
+                    errors_append(f"Unknown field: {key}")
                     continue
-
-            field_mapping = mappings.get(key)
-            if not field_mapping:
-                continue
-
-            # Validate choice fields
-            if field_mapping["type"] == "choice" and "options" in field_mapping:
-                if isinstance(value, str):
-                    # Check if value is valid
-                    valid_options = list(field_mapping["options"].keys())
-                    if value.lower() not in field_mapping["options"]:
-                        # Show only primary option names
-                        display_options = [
-                            opt
-                            for opt in valid_options
-                            if "-" not in opt or opt.startswith("listing")
-                        ]
-                        errors.append(
-                            f"Invalid value '{value}' for field '{key}'. "
-                            f"Valid options: {', '.join(sorted(set(display_options)))}"
-                        )
+                key = canonical_key
+
+            # Validate choice fields against the precompiled option sets
+            choice = choice_get(key)
+            if choice is not None and isinstance(value, str):
+                options, display_options = choice
+                if value.lower() not in options:
+                    errors_append(
+                        f"Invalid value '{value}' for field '{key}'. "
+                        f"Valid options: {', '.join(display_options)}"
+                    )
 
         return (len(errors) == 0, errors)
+
+    def _get_cached_mappings(
+        self, ttl: float = _FIELD_MAPPINGS_TTL
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get field mappings, bounding how stale the cached copy may get.
+
+        The properties client already memoizes mappings per instance; this
+        helper adds a TTL on top so long-lived composite clients pick up
+        schema changes without callers having to refresh manually. Batch
+        workflows validating N records therefore pay for at most one fetch
+        per TTL window instead of one per record.
+
+        Args:
+            ttl: Maximum age of the cached mappings in seconds
+
+        Returns:
+            Dictionary mapping field names to their metadata
+        """
+        # Settle any in-flight background prefetch first; errors from the
+        # prefetch surface here, exactly where a synchronous fetch would
+        prefetch = self._prefetch_future
+        if prefetch is not None:
+            self._prefetch_future = None
+            prefetch.result()
+            self._field_mappings_fetched_at = time.monotonic()
+
+        now = time.monotonic()
+        fetched_at = self._field_mappings_fetched_at
+
+        if fetched_at is not None and now - fetched_at >= ttl:
+            mappings = self.properties.refresh_field_mappings()
+            self._field_mappings_fetched_at = time.monotonic()
+        else:
+            mappings = self.properties.get_field_mappings()
+            if fetched_at is None:
+                self._field_mappings_fetched_at = now
+
+        return mappings
+
+    def _get_validation_schema(self) -> Dict[str, Any]:
+        """Get the compiled validation schema, rebuilding it only when needed.
+
+        The schema precomputes the lookup tables validate_property_data needs
+        (alias resolution and per-field choice options) so each validation
+        call is dictionary probes instead of rebuilding lists and sets. It is
+        recompiled only when the underlying field mappings change, e.g. after
+        refresh_field_mappings().
+
+        Returns:
+            Dictionary with the compiled validation lookup tables
+        """
+        mappings = self._get_cached_mappings()
+
+        if self._validation_schema is None or self._validation_schema_source is not (
+            mappings
+        ):
+            # For choice fields, precompute the option lookup and the sorted
+            # display names shown in error messages
+            # Option keys are lowercased when mappings are built, but fold
+            # them here as well so membership tests can rely on it. The
+            # frozenset gives O(1) lookups without carrying the id values.
+            choice_options = {}
+            for field_key, mapping in mappings.items():
+                if mapping["type"] == "choice" and "options" in mapping:
+                    choice_options[field_key] = (
+                        frozenset(option.lower() for option in mapping["options"]),
+                        _display_options(mapping),
+                    )
+
+            self._validation_schema = {
+                "mappings": mappings,
+                "alias_to_field": _ALIAS_TO_FIELD,
+                "choice_options": choice_options,
+            }
+            self._validation_schema_source = mappings
+
+        return self._validation_schema
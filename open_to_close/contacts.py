@@ -1,8 +1,11 @@
 """Contacts client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +20,30 @@ class ContactsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the contacts client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized ContactsAPI client")
 
     def _validate_contact_data(
@@ -90,7 +104,7 @@ class ContactsAPI(BaseClient):
                         f"{name_field} must be a non-empty string, got: {name_value}"
                     )
 
-        logger.debug(f"Contact data validated for {operation} operation")
+        logger.debug("Contact data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -125,7 +139,7 @@ class ContactsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -190,11 +204,11 @@ class ContactsAPI(BaseClient):
             response = self.get("/contacts", params=validated_params)
             result = self._process_list_response(response, "/contacts")
 
-            logger.info(f"Successfully retrieved {len(result)} contacts")
+            logger.info("Successfully retrieved %d contacts", len(result))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list contacts: {str(e)}", extra={"params": params})
+            logger.error("Failed to list contacts: %s", e, extra={"params": params})
             raise
 
     def create_contact(self, contact_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -259,12 +273,13 @@ class ContactsAPI(BaseClient):
             result = self._process_response_data(response, "/contacts")
 
             contact_id = result.get("id")
-            logger.info(f"Successfully created contact with ID: {contact_id}")
+            logger.info("Successfully created contact with ID: %s", contact_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create contact: {str(e)}",
+                "Failed to create contact: %s",
+                e,
                 extra={
                     "contact_data_keys": (
                         list(contact_data.keys())
@@ -305,15 +320,15 @@ class ContactsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(contact_id, "contact")
 
-            logger.info(f"Retrieving contact with ID: {validated_id}")
+            logger.info("Retrieving contact with ID: %s", validated_id)
             response = self.get(f"/contacts/{validated_id}")
             result = self._process_response_data(response, f"/contacts/{validated_id}")
 
-            logger.info(f"Successfully retrieved contact: {validated_id}")
+            logger.info("Successfully retrieved contact: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve contact {contact_id}: {str(e)}")
+            logger.error("Failed to retrieve contact %s: %s", contact_id, e)
             raise
 
     def update_contact(
@@ -355,18 +370,21 @@ class ContactsAPI(BaseClient):
             self._validate_contact_data(contact_data, "update")
 
             logger.info(
-                f"Updating contact with ID: {validated_id}",
+                "Updating contact with ID: %s",
+                validated_id,
                 extra={"update_fields": list(contact_data.keys())},
             )
             response = self.put(f"/contacts/{validated_id}", json_data=contact_data)
             result = self._process_response_data(response, f"/contacts/{validated_id}")
 
-            logger.info(f"Successfully updated contact: {validated_id}")
+            logger.info("Successfully updated contact: %s", validated_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update contact {contact_id}: {str(e)}",
+                "Failed to update contact %s: %s",
+                contact_id,
+                e,
                 extra={
                     "contact_data_keys": (
                         list(contact_data.keys())
@@ -404,12 +422,12 @@ class ContactsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(contact_id, "contact")
 
-            logger.info(f"Deleting contact with ID: {validated_id}")
+            logger.info("Deleting contact with ID: %s", validated_id)
             result = self.delete(f"/contacts/{validated_id}")
 
-            logger.info(f"Successfully deleted contact: {validated_id}")
+            logger.info("Successfully deleted contact: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to delete contact {contact_id}: {str(e)}")
+            logger.error("Failed to delete contact %s: %s", contact_id, e)
             raise
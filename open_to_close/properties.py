@@ -1,13 +1,76 @@
 """Properties client for Open To Close API."""
 
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from .base_client import BaseClient
+import requests
+
+try:  # Optional streaming parser (pip install open-to-close[speed])
+    import ijson
+except ImportError:  # pragma: no cover - depends on environment
+    ijson = None  # type: ignore[assignment]
+
+from .base_client import BaseClient, cached_get
 from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Translation table turning spaces into hyphens for option-name matching;
+# str.translate runs the substitution in C without scanning for substrings
+_SPACE_TO_HYPHEN = str.maketrans(" ", "-")
+
+# Field groups probed on every validation/conversion call, hoisted to
+# module-level constants so the hot paths allocate nothing per call and
+# membership tests hash instead of scanning a list
+_TITLE_FIELDS = frozenset({"contract_title", "field_926565"})
+_TITLE_KEYS = ("title", "contract_title", "field_926565")
+_ADDRESS_FIELDS = frozenset(
+    {"property_address", "property_city", "property_state", "property_zip"}
+)
+_NUMERIC_FIELDS = frozenset({"property_price", "sale_price", "list_price"})
+_REQUIRED_FIELD_KEYS = ("contract_title", "contract_client_type", "contract_status")
+
+# Simple-format aliases for the required contract fields
+_FIELD_ALIASES = {
+    "title": "contract_title",
+    "client_type": "contract_client_type",
+    "status": "contract_status",
+}
+_KNOWN_ALIASES = frozenset(_FIELD_ALIASES)
+
+# Sentinel distinguishing "absent" from any real value, so optional keys are
+# probed with a single .get() instead of an `in` check plus an indexing
+_MISSING: Any = object()
+
+
+class _PrefixedReader:
+    """File-like wrapper replaying sniffed bytes ahead of the stream.
+
+    iter_property_fields peeks at the first byte of the streamed body to
+    decide whether the payload is a bare array or a {"data": [...]}
+    wrapper; this wrapper hands that byte back to the parser first.
+    """
+
+    def __init__(self, prefix: bytes, stream: Any) -> None:
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if self._prefix:
+            prefix, self._prefix = self._prefix, b""
+            if size < 0:
+                rest: bytes = self._stream.read(size)
+                return prefix + rest
+            if len(prefix) >= size:
+                self._prefix = prefix[size:]
+                return prefix[:size]
+            rest = self._stream.read(size - len(prefix))
+            return prefix + rest
+        data: bytes = self._stream.read(size)
+        return data
+
 
 class PropertiesAPI(BaseClient):
     """Client for properties API endpoints.
@@ -17,19 +80,44 @@ class PropertiesAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the properties client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
+
+        # Completed create_property responses keyed by caller-supplied
+        # idempotency key, so client-side retries do not create duplicates
+        self._idempotent_create_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Auto-detected team member ID, resolved at most once per client so
+        # bulk creates do not repeat the list_teams round-trip
+        self._cached_team_member_id: Optional[int] = None
+
+        # Field IDs of the required contract fields, resolved once per
+        # field-mappings dict (identity-checked) for the conversion hot path
+        self._required_field_ids: frozenset = frozenset()
+        self._required_ids_source: Optional[Dict[str, Dict[str, Any]]] = None
+
         logger.debug("Initialized PropertiesAPI client")
 
     def _validate_property_data(
@@ -44,7 +132,7 @@ class PropertiesAPI(BaseClient):
         Raises:
             ValidationError: If property data is invalid
         """
-        if not isinstance(property_data, dict):
+        if type(property_data) is not dict:
             raise ValidationError(
                 f"Property data for {operation} must be a dictionary, got {type(property_data).__name__}"
             )
@@ -54,25 +142,23 @@ class PropertiesAPI(BaseClient):
 
         # Validate required fields for create operations
         if operation == "create":
-            # Check for title in different formats
-            has_title = False
-
-            # Check traditional field names
-            if "contract_title" in property_data or "field_926565" in property_data:
-                has_title = True
+            # Check traditional field names first - two dict probes cover
+            # the common case without touching the fields array
+            has_title = (
+                "contract_title" in property_data or "field_926565" in property_data
+            )
 
-            # Check fields array format (converted API format)
-            elif "fields" in property_data and isinstance(
-                property_data["fields"], list
-            ):
-                for field in property_data["fields"]:
-                    if isinstance(field, dict):
-                        if (
-                            field.get("key") == "contract_title"
-                            or field.get("id") == 926565
-                        ):
-                            has_title = True
-                            break
+            # Check fields array format (converted API format); any()
+            # short-circuits in C on the first matching field
+            if not has_title:
+                fields = property_data.get("fields")
+                if type(fields) is list:
+                    has_title = any(
+                        field.get("key") == "contract_title"
+                        or field.get("id") == 926565
+                        for field in fields
+                        if type(field) is dict
+                    )
 
             if not has_title:
                 raise ValidationError(
@@ -80,57 +166,60 @@ class PropertiesAPI(BaseClient):
                     f"Use either 'contract_title' or 'field_926565'"
                 )
 
+        # Intersect the payload's keys with each field group so only the
+        # fields actually present are visited; the dict keys view intersects
+        # with the frozensets natively in O(min(len)) without probing every
+        # known field name
+
         # Validate contract_title if provided (both traditional and field ID formats)
-        title_fields = ["contract_title", "field_926565"]
-        for field_name in title_fields:
-            if field_name in property_data:
-                title = property_data[field_name]
-                if not isinstance(title, str) or len(title.strip()) == 0:
-                    raise ValidationError(
-                        f"{field_name} must be a non-empty string, got: {title}"
-                    )
+        for field_name in property_data.keys() & _TITLE_FIELDS:
+            title = property_data[field_name]
+            # not/isspace cover the empty and whitespace-only cases without
+            # allocating the stripped copy that strip() would build
+            if type(title) is not str or not title or title.isspace():
+                raise ValidationError(
+                    f"{field_name} must be a non-empty string, got: {title}"
+                )
 
         # Validate address fields if provided
-        address_fields = [
-            "property_address",
-            "property_city",
-            "property_state",
-            "property_zip",
-        ]
-        for field in address_fields:
-            if field in property_data:
-                value = property_data[field]
-                if not isinstance(value, str) or len(value.strip()) == 0:
-                    raise ValidationError(
-                        f"{field} must be a non-empty string, got: {value}"
-                    )
+        for field in property_data.keys() & _ADDRESS_FIELDS:
+            value = property_data[field]
+            if type(value) is not str or not value or value.isspace():
+                raise ValidationError(
+                    f"{field} must be a non-empty string, got: {value}"
+                )
 
         # Validate numeric fields if provided
-        numeric_fields = ["property_price", "sale_price", "list_price"]
-        for field in numeric_fields:
-            if field in property_data:
-                value = property_data[field]
-                if value is not None:
+        for field in property_data.keys() & _NUMERIC_FIELDS:
+            value = property_data[field]
+            if value is not None:
+                # Dispatch on the concrete type first: int/float inputs are
+                # the common case and skip the try/except setup entirely;
+                # everything else still goes through float() coercion
+                value_type = type(value)
+                if value_type is int or value_type is float:
+                    float_value = value
+                else:
                     try:
                         float_value = float(value)
-                        if float_value < 0:
-                            raise ValidationError(
-                                f"{field} must be non-negative, got: {float_value}"
-                            )
                     except (ValueError, TypeError):
                         raise ValidationError(
-                            f"{field} must be a number, got {type(value).__name__}: {value}"
+                            f"{field} must be a number, got {value_type.__name__}: {value}"
                         )
+                if float_value < 0:
+                    raise ValidationError(
+                        f"{field} must be non-negative, got: {float_value}"
+                    )
 
         # Validate status if provided
-        if "status" in property_data:
-            status = property_data["status"]
-            if not isinstance(status, str) or len(status.strip()) == 0:
+        status = property_data.get("status", _MISSING)
+        if status is not _MISSING:
+            if type(status) is not str or not status or status.isspace():
                 raise ValidationError(
                     f"status must be a non-empty string, got: {status}"
                 )
 
-        logger.debug(f"Property data validated for {operation} operation")
+        logger.debug("Property data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -139,7 +228,9 @@ class PropertiesAPI(BaseClient):
             params: Parameters to validate
 
         Returns:
-            Validated and normalized parameters
+            Validated and normalized parameters. The input dictionary is
+            returned as-is when no value needed coercion; a copy is only
+            made when a limit/offset value has to be normalized.
 
         Raises:
             ValidationError: If parameters are invalid
@@ -147,61 +238,78 @@ class PropertiesAPI(BaseClient):
         if params is None:
             return {}
 
-        if not isinstance(params, dict):
+        if type(params) is not dict:
             raise ValidationError(
                 f"List parameters must be a dictionary, got {type(params).__name__}"
             )
 
-        validated_params = params.copy()
+        # Copy lazily: most callers already pass well-typed params
+        validated_params = params
 
         # Validate limit parameter
-        if "limit" in validated_params:
-            limit = validated_params["limit"]
-            try:
-                limit_int = int(limit)
-                if limit_int <= 0:
+        limit = params.get("limit", _MISSING)
+        if limit is not _MISSING:
+            if type(limit) is int:
+                limit_int = limit
+            else:
+                try:
+                    limit_int = int(limit)
+                except (ValueError, TypeError):
                     raise ValidationError(
-                        f"Limit must be a positive integer, got {limit_int}"
-                    )
-                if limit_int > 1000:  # Reasonable upper bound
-                    logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        f"Limit must be an integer, got {type(limit).__name__}: {limit}"
                     )
+                if validated_params is params:
+                    validated_params = params.copy()
                 validated_params["limit"] = limit_int
-            except (ValueError, TypeError):
+            if limit_int <= 0:
                 raise ValidationError(
-                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
+                    f"Limit must be a positive integer, got {limit_int}"
+                )
+            if limit_int > 1000:  # Reasonable upper bound
+                logger.warning(
+                    "Large limit value: %d. Consider using pagination.", limit_int
                 )
 
         # Validate offset parameter
-        if "offset" in validated_params:
-            offset = validated_params["offset"]
-            try:
-                offset_int = int(offset)
-                if offset_int < 0:
+        offset = params.get("offset", _MISSING)
+        if offset is not _MISSING:
+            if type(offset) is int:
+                offset_int = offset
+            else:
+                try:
+                    offset_int = int(offset)
+                except (ValueError, TypeError):
                     raise ValidationError(
-                        f"Offset must be non-negative, got {offset_int}"
+                        f"Offset must be an integer, got {type(offset).__name__}: {offset}"
                     )
+                if validated_params is params:
+                    validated_params = params.copy()
                 validated_params["offset"] = offset_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
-                )
+            if offset_int < 0:
+                raise ValidationError(f"Offset must be non-negative, got {offset_int}")
 
         # Validate status filter if provided
-        if "status" in validated_params:
-            status = validated_params["status"]
-            if not isinstance(status, str) or len(status.strip()) == 0:
+        status = params.get("status", _MISSING)
+        if status is not _MISSING:
+            if type(status) is not str or not status or status.isspace():
                 raise ValidationError(
                     f"Status filter must be a non-empty string, got: {status}"
                 )
 
-        logger.debug("List parameters validated", extra={"params": validated_params})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "List parameters validated", extra={"params": validated_params}
+            )
         return validated_params
 
     def _get_field_mappings(self) -> Dict[str, Dict[str, Any]]:
         """Get field ID and option mappings for the API.
 
+        The base client memoizes the mappings per instance, so only the
+        first call per client performs the /propertyFields round-trip;
+        every create afterwards reuses the cached dictionary. Use
+        refresh_field_mappings() to force a reload.
+
         Returns:
             Dictionary containing field mappings and option values
         """
@@ -209,7 +317,11 @@ class PropertiesAPI(BaseClient):
         return self.get_field_mappings()
 
     def _get_team_member_id(self) -> int:
-        """Auto-detect a valid team member ID.
+        """Auto-detect a valid team member ID, memoized per client.
+
+        The detection requires a full list_teams round-trip, so the result
+        (including the fallback) is cached on the instance; repeated creates
+        reuse it instead of refetching the teams list every time.
 
         Returns:
             Team member ID
@@ -217,24 +329,42 @@ class PropertiesAPI(BaseClient):
         Raises:
             ValidationError: If no team members found
         """
+        if self._cached_team_member_id is not None:
+            return self._cached_team_member_id
+
         try:
             # Import here to avoid circular imports
             from .teams import TeamsAPI
 
-            teams_client = TeamsAPI(api_key=self.api_key, base_url=self.base_url)
+            teams_client = TeamsAPI(
+                api_key=self.api_key, base_url=self.base_url, session=self.session
+            )
             teams = teams_client.list_teams()
 
+            team_member_id = None
             for team in teams:
                 if team.get("team_members"):
-                    # Return the first team member ID found
-                    return int(team["team_members"][0]["id"])
+                    # Use the first team member ID found
+                    team_member_id = int(team["team_members"][0]["id"])
+                    break
 
-            raise ValidationError("No team members found in any teams")
+            if team_member_id is None:
+                raise ValidationError("No team members found in any teams")
 
         except Exception as e:
             # Fallback to known working team member ID
-            logger.warning(f"Could not auto-detect team member, using fallback: {e}")
-            return 26392  # John Barry - known working ID
+            logger.warning("Could not auto-detect team member, using fallback: %s", e)
+            team_member_id = 26392  # John Barry - known working ID
+
+        self._cached_team_member_id = team_member_id
+        return team_member_id
+
+    def invalidate_team_member_cache(self) -> None:
+        """Clear the memoized team member ID.
+
+        The next create that needs auto-detection will re-run list_teams.
+        """
+        self._cached_team_member_id = None
 
     def _extract_title_from_data(
         self, property_data: Union[str, Dict[str, Any]]
@@ -247,24 +377,30 @@ class PropertiesAPI(BaseClient):
         Returns:
             Property title
         """
-        if isinstance(property_data, str):
+        if type(property_data) is str:
             return property_data
 
-        if isinstance(property_data, dict):
-            # Check various title fields
-            for field in ["title", "contract_title", "field_926565"]:
-                if field in property_data:
-                    return str(property_data[field])
+        if type(property_data) is dict:
+            # Check various title fields; next() stops at the first hit
+            title_key = next((k for k in _TITLE_KEYS if k in property_data), None)
+            if title_key is not None:
+                return str(property_data[title_key])
 
             # Check fields array
-            if "fields" in property_data:
-                for field in property_data["fields"]:
-                    if isinstance(field, dict):
-                        if (
+            fields = property_data.get("fields")
+            if fields is not None:
+                return next(
+                    (
+                        str(field.get("value", "Unknown"))
+                        for field in fields
+                        if type(field) is dict
+                        and (
                             field.get("key") == "contract_title"
                             or field.get("id") == 926565
-                        ):
-                            return str(field.get("value", "Unknown"))
+                        )
+                    ),
+                    "Unknown",
+                )
 
         return "Unknown"
 
@@ -282,13 +418,15 @@ class PropertiesAPI(BaseClient):
             preserve_text_values: If True, keeps choice field text values instead of converting to IDs
 
         Returns:
-            API-formatted property data
+            API-formatted property data. Input already in API format is
+            returned as-is (not copied); callers must not expect an
+            independent dictionary.
 
         Raises:
             ValidationError: If input data is invalid
         """
         # Handle string input (just title)
-        if isinstance(property_data, str):
+        if type(property_data) is str:
             if not property_data.strip():
                 raise ValidationError("Property title cannot be empty")
 
@@ -301,23 +439,139 @@ class PropertiesAPI(BaseClient):
             )
 
         # Handle dictionary input
-        if not isinstance(property_data, dict):
+        if type(property_data) is not dict:
             raise ValidationError(
                 f"Property data must be string or dict, got {type(property_data).__name__}"
             )
 
-        # If already in API format (has 'fields' key), validate and return
+        # If already in API format (has 'fields' key), validate and return.
+        # The payload is passed straight through to the request layer, which
+        # never mutates it, so no defensive copy is taken.
         if "fields" in property_data and "team_member_id" in property_data:
             # Validate existing API format
-            if not isinstance(property_data["fields"], list):
+            if type(property_data["fields"]) is not list:
                 raise ValidationError("API format 'fields' must be a list")
-            return property_data.copy()
+            return property_data
 
         # Convert simple format to API format
         return self._convert_simple_to_api_format(
             property_data, team_member_id, preserve_text_values
         )
 
+    def _iter_field_entries(
+        self,
+        all_data: Dict[str, Any],
+        field_mappings: Dict[str, Dict[str, Any]],
+        preserve_text_values: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield API field entries for simple-format key/value pairs.
+
+        Generator form of the conversion loop: each entry is produced and
+        consumed in place, so the caller builds the fields list in a single
+        pass without intermediate per-field bookkeeping in the caller.
+
+        Args:
+            all_data: Merged simple data including required defaults
+            field_mappings: Field mappings from the per-instance cache
+            preserve_text_values: If True, keeps choice field text values
+                instead of converting to IDs
+
+        Yields:
+            Field entry dictionaries with "id" and "value" keys
+        """
+        # Bind the per-iteration lookups once; inside the loops these are
+        # plain local loads instead of repeated attribute/global lookups
+        alias_get = _FIELD_ALIASES.get
+        warn = logger.warning
+
+        # Resolve aliases up front; keeping only the first occurrence per
+        # resolved key means the conversion loop below needs no duplicate
+        # tracking and every mapping lookup is a guaranteed hit
+        resolved: Dict[str, Any] = {}
+        for field_key, value in all_data.items():
+            if value is None:
+                continue
+
+            # Check if this is an alias
+            actual_field_key = alias_get(field_key, field_key)
+
+            # Skip if already seen
+            if actual_field_key in resolved:
+                continue
+
+            if actual_field_key not in field_mappings:
+                # Skip unknown fields with a warning
+                if field_key not in _KNOWN_ALIASES:  # Don't warn for known aliases
+                    warn("Unknown field '%s' - skipping", field_key)
+                continue
+
+            resolved[actual_field_key] = value
+
+        for actual_field_key, value in resolved.items():
+            field_mapping = field_mappings[actual_field_key]
+            field_id = field_mapping.get("id")
+            field_type = field_mapping.get("type")
+
+            # Prepare field value
+            field_value: Any = value
+
+            # Handle choice fields - convert human-readable values to option IDs
+            if field_type == "choice" and "options" in field_mapping:
+                if isinstance(value, str) and not preserve_text_values:
+                    # Look up option ID (case-insensitive) in the normalized
+                    # table precomputed when mappings were loaded. The value
+                    # is case-folded and reshaped once up front; each match
+                    # attempt is then a single dict get with no further
+                    # string allocation.
+                    options = field_mapping["options"]
+                    norm_options = field_mapping.get("_normalized_options", options)
+
+                    v_lower = value.lower()
+                    v_hyphen = v_lower.translate(_SPACE_TO_HYPHEN)
+
+                    # Exact, hyphenated, "listing-"-stripped, and
+                    # space-normalized probes, in the original order
+                    option_id = norm_options.get(v_lower) or norm_options.get(v_hyphen)
+                    if not option_id and v_hyphen.startswith("listing-"):
+                        option_id = norm_options.get(v_hyphen[8:])
+                    if not option_id:
+                        option_id = norm_options.get(v_lower.replace("-", " "))
+
+                    if option_id:
+                        field_value = option_id
+                    else:
+                        # Building the option summary walks the whole option
+                        # table, so skip it entirely unless warnings are on
+                        if logger.isEnabledFor(logging.WARNING):
+                            # Show valid options without duplicates
+                            display_options = []
+                            seen_normalized = set()
+                            for opt in options.keys():
+                                normalized = opt.replace("-", " ").replace(
+                                    "listing ", ""
+                                )
+                                if normalized not in seen_normalized:
+                                    seen_normalized.add(normalized)
+                                    # Use the cleanest version
+                                    if not opt.startswith("listing") and "-" not in opt:
+                                        display_options.append(opt)
+
+                            warn(
+                                "Unknown option '%s' for field '%s'. Valid options: %s",
+                                value,
+                                actual_field_key,
+                                ", ".join(sorted(display_options)),
+                            )
+                        continue
+
+            # Note: For choice fields with numeric IDs, keep as int; otherwise convert to string
+            if field_type == "choice" and isinstance(field_value, int):
+                # Keep numeric option IDs as integers
+                yield {"id": field_id, "value": field_value}
+            else:
+                # Convert other values to strings
+                yield {"id": field_id, "value": str(field_value)}
+
     def _convert_simple_to_api_format(
         self,
         simple_data: Dict[str, Any],
@@ -334,23 +588,13 @@ class PropertiesAPI(BaseClient):
         Returns:
             API-formatted dictionary
         """
-        # Get field mappings from API
-        field_mappings = self.get_field_mappings()
+        # Get field mappings from the per-instance cache (fetched once)
+        field_mappings = self._get_field_mappings()
 
         # Get team member ID
         if team_member_id is None:
             team_member_id = self._get_team_member_id()
 
-        # Build fields array
-        fields = []
-
-        # Define field aliases
-        field_aliases = {
-            "title": "contract_title",
-            "client_type": "contract_client_type",
-            "status": "contract_status",
-        }
-
         # Required fields with defaults
         required_defaults = {
             "contract_title": simple_data.get("title")
@@ -370,111 +614,30 @@ class PropertiesAPI(BaseClient):
         # Process all fields including required defaults
         all_data = {**simple_data, **required_defaults}
 
-        # Track processed fields to avoid duplicates
-        processed_fields = set()
-
-        for field_key, value in all_data.items():
-            if value is None:
-                continue
-
-            # Check if this is an alias
-            actual_field_key = field_aliases.get(field_key, field_key)
-
-            # Skip if already processed
-            if actual_field_key in processed_fields:
-                continue
-
-            # Get field mapping
-            field_mapping = field_mappings.get(actual_field_key)
-            if not field_mapping:
-                # Skip unknown fields with a warning
-                if field_key not in [
-                    "title",
-                    "client_type",
-                    "status",
-                ]:  # Don't warn for known aliases
-                    logger.warning(f"Unknown field '{field_key}' - skipping")
-                continue
-
-            processed_fields.add(actual_field_key)
-            field_id = field_mapping.get("id")
-            field_type = field_mapping.get("type")
-
-            # Prepare field value
-            field_value: Any = value
-
-            # Handle choice fields - convert human-readable values to option IDs
-            if field_type == "choice" and "options" in field_mapping:
-                if isinstance(value, str) and not preserve_text_values:
-                    # Look up option ID (case-insensitive)
-                    options = field_mapping["options"]
-
-                    # Try exact match first
-                    option_id = options.get(value.lower())
-
-                    if not option_id:
-                        # Try with various formats
-                        value_normalized = value.lower().replace(" ", "-")
-                        option_id = options.get(value_normalized)
-
-                    if not option_id:
-                        # Try removing "listing-" prefix
-                        if value_normalized.startswith("listing-"):
-                            clean_value = value_normalized[8:]
-                            option_id = options.get(clean_value)
-
-                    if not option_id:
-                        # Try partial matches for common variations
-                        for opt_key, opt_id in options.items():
-                            if opt_key.replace("-", " ") == value.lower().replace(
-                                "-", " "
-                            ):
-                                option_id = opt_id
-                                break
+        fields = list(
+            self._iter_field_entries(all_data, field_mappings, preserve_text_values)
+        )
 
-                    if option_id:
-                        field_value = option_id
-                    else:
-                        # Show valid options without duplicates
-                        display_options = []
-                        seen_normalized = set()
-                        for opt in options.keys():
-                            normalized = opt.replace("-", " ").replace("listing ", "")
-                            if normalized not in seen_normalized:
-                                seen_normalized.add(normalized)
-                                # Use the cleanest version
-                                if not opt.startswith("listing") and "-" not in opt:
-                                    display_options.append(opt)
-
-                        logger.warning(
-                            f"Unknown option '{value}' for field '{actual_field_key}'. "
-                            f"Valid options: {', '.join(sorted(display_options))}"
-                        )
-                        continue
+        # Ensure required fields are present. The required IDs are resolved
+        # once per mappings dict; the happy path is a single subset check.
+        field_ids_present = {f["id"] for f in fields}
 
-            # Add field to array
-            # Note: For choice fields with numeric IDs, keep as int; otherwise convert to string
-            if field_type == "choice" and isinstance(field_value, int):
-                # Keep numeric option IDs as integers
-                fields.append({"id": field_id, "value": field_value})
-            else:
-                # Convert other values to strings
-                fields.append({"id": field_id, "value": str(field_value)})
+        if self._required_ids_source is not field_mappings:
+            self._required_field_ids = frozenset(
+                field_mappings[key]["id"]
+                for key in _REQUIRED_FIELD_KEYS
+                if key in field_mappings
+            )
+            self._required_ids_source = field_mappings
 
-        # Ensure required fields are present
-        field_ids_present = {f["id"] for f in fields}
-        required_field_keys = [
-            "contract_title",
-            "contract_client_type",
-            "contract_status",
-        ]
-
-        for req_key in required_field_keys:
-            req_mapping = field_mappings.get(req_key)
-            if req_mapping and req_mapping["id"] not in field_ids_present:
-                raise ValidationError(
-                    f"Required field '{req_key}' is missing or has invalid value"
-                )
+        if not self._required_field_ids <= field_ids_present:
+            # Walk the keys only on failure, to name the first missing field
+            for req_key in _REQUIRED_FIELD_KEYS:
+                req_mapping = field_mappings.get(req_key)
+                if req_mapping and req_mapping["id"] not in field_ids_present:
+                    raise ValidationError(
+                        f"Required field '{req_key}' is missing or has invalid value"
+                    )
 
         return {
             "team_member_id": team_member_id,
@@ -554,24 +717,74 @@ class PropertiesAPI(BaseClient):
         try:
             validated_params = self._validate_list_params(params)
 
-            logger.info("Listing properties", extra={"params": validated_params})
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Listing properties", extra={"params": validated_params})
             response = self.get("/properties", params=validated_params)
             result = self._process_list_response(response, "/properties")
 
-            logger.info(f"Successfully retrieved {len(result)} properties")
+            logger.info("Successfully retrieved %d properties", len(result))
             return result
 
         except Exception as e:
-            logger.error(
-                f"Failed to list properties: {str(e)}", extra={"params": params}
-            )
+            logger.error("Failed to list properties: %s", e, extra={"params": params})
             raise
 
+    def iter_properties(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over properties lazily, fetching pages on demand.
+
+        Unlike list_properties(), which materializes the full result before
+        returning, this yields each property as its page arrives, so large
+        portfolios can be processed with one page in memory at a time and a
+        caller that breaks out early skips the remaining requests entirely.
+
+        Args:
+            params: Optional dictionary of query parameters for filtering,
+                   as accepted by list_properties(); limit/offset are
+                   managed by the paging loop
+            page_size: Number of properties fetched per request
+
+        Yields:
+            Dictionaries representing individual properties
+
+        Raises:
+            ValidationError: If parameters are invalid
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+
+        Example:
+            ```python
+            for prop in client.properties.iter_properties(
+                params={"status": "active"}
+            ):
+                if prop["id"] == target_id:
+                    break
+            ```
+        """
+        validated_params = self._validate_list_params(params)
+        # The paging loop owns limit/offset; drop caller-supplied values so
+        # they do not fight the iteration bookkeeping
+        validated_params = {
+            k: v for k, v in validated_params.items() if k not in ("limit", "offset")
+        }
+
+        logger.info("Iterating properties", extra={"params": validated_params})
+        return self.iter_paginated(
+            "/properties", params=validated_params, page_size=page_size
+        )
+
     def create_property(
         self,
         property_data: Union[str, Dict[str, Any]],
         team_member_id: Optional[int] = None,
         preserve_text_values: bool = False,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create a new property with simple or advanced options.
 
@@ -624,6 +837,10 @@ class PropertiesAPI(BaseClient):
             property_data: Property information as string (title only) or dictionary
             team_member_id: Optional team member ID (auto-detected if not provided)
             preserve_text_values: If True, keeps choice field text values instead of converting to IDs
+            idempotency_key: Optional caller-chosen key identifying this create.
+                If a create with the same key already succeeded on this client,
+                the memoized response is returned without issuing another POST,
+                making application-level retries safe
 
         Returns:
             A dictionary representing the newly created property with at least:
@@ -670,32 +887,57 @@ class PropertiesAPI(BaseClient):
             }, preserve_text_values=True)
             ```
         """
+        if idempotency_key is not None:
+            cached_result = self._idempotent_create_cache.get(idempotency_key)
+            if cached_result is not None:
+                logger.info(
+                    "Returning memoized property for idempotency key: %s",
+                    idempotency_key,
+                )
+                return cached_result
+
         try:
+            # API-format passthrough skips conversion, so it still needs the
+            # full validation pass; converted payloads already had required
+            # fields enforced during conversion and would only be re-scanned
+            is_api_format = (
+                type(property_data) is dict
+                and "fields" in property_data
+                and "team_member_id" in property_data
+            )
+
             # Convert input to API format
             api_data = self._prepare_property_data(
                 property_data, team_member_id, preserve_text_values
             )
 
-            # Validate the prepared data
-            self._validate_property_data(api_data, "create")
+            if is_api_format:
+                self._validate_property_data(api_data, "create")
 
-            title = self._extract_title_from_data(property_data)
-            logger.info(
-                "Creating new property",
-                extra={"title": title},
-            )
+            # The title is only needed for the log record, so skip the
+            # extraction scan when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Creating new property",
+                    extra={"title": self._extract_title_from_data(property_data)},
+                )
 
             # Properties POST endpoint requires trailing slash (per successful tests)
             response = self.post("/properties/", json_data=api_data)
             result = self._process_response_data(response, "/properties/")
 
             property_id = result.get("id")
-            logger.info(f"Successfully created property with ID: {property_id}")
+            logger.info("Successfully created property with ID: %s", property_id)
+
+            if idempotency_key is not None:
+                self._idempotent_create_cache[idempotency_key] = result
+
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create property: {str(e)}",
+                "Failed to create property: %s",
+                e,
                 extra={
                     "input_type": type(property_data).__name__,
                     "property_data_keys": (
@@ -707,6 +949,146 @@ class PropertiesAPI(BaseClient):
             )
             raise
 
+    def create_properties_bulk(
+        self,
+        payloads: List[Union[str, Dict[str, Any]]],
+        team_member_id: Optional[int] = None,
+        preserve_text_values: bool = False,
+        max_workers: Optional[int] = None,
+        deduplicate: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Create multiple properties in a single batched call.
+
+        All payloads are validated and converted to API format up front, so
+        invalid input fails fast before any property is created. Shared
+        lookups (field mappings, team member auto-detection) are resolved
+        once for the whole batch instead of once per property, and all
+        requests reuse the pooled HTTP session. With ``max_workers`` set,
+        the creation requests are issued in parallel over a thread pool so
+        the batch takes roughly one round-trip of wall time instead of one
+        per property.
+
+        Args:
+            payloads: List of property payloads. Each entry accepts the same
+                formats as :meth:`create_property` (title string, simple
+                dictionary, or full API format)
+            team_member_id: Optional team member ID applied to every payload
+                (auto-detected once if not provided)
+            preserve_text_values: If True, keeps choice field text values
+                instead of converting to IDs
+            max_workers: Number of concurrent creation requests. Defaults to
+                sequential creation; values above 1 fan the requests out over
+                a thread pool
+            deduplicate: If True, payloads that prepare to an identical API
+                request are POSTed only once; duplicate entries share the
+                created property in the returned list
+
+        Returns:
+            A list of dictionaries representing the newly created properties,
+            in the same order as the input payloads
+
+        Raises:
+            ValidationError: If any payload is invalid or missing required fields
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+
+        Example:
+            ```python
+            properties = client.properties.create_properties_bulk([
+                "Quick Sale Property",
+                {"title": "Luxury Estate", "client_type": "Buyer", "status": "Active"},
+            ])
+            for property in properties:
+                print(property["id"])
+            ```
+        """
+        if not isinstance(payloads, list):
+            raise ValidationError(
+                f"Bulk payloads must be a list, got {type(payloads).__name__}"
+            )
+
+        if not payloads:
+            raise ValidationError("Bulk payloads cannot be empty")
+
+        try:
+            # Prepare and validate all payloads before creating anything
+            resolved_team_member_id = team_member_id
+            api_payloads = []
+            for payload in payloads:
+                # API-format payloads pass through preparation untouched and
+                # still need validating; converted ones were already checked
+                # during conversion
+                is_api_format = (
+                    type(payload) is dict
+                    and "fields" in payload
+                    and "team_member_id" in payload
+                )
+                if resolved_team_member_id is None and not is_api_format:
+                    resolved_team_member_id = self._get_team_member_id()
+
+                api_data = self._prepare_property_data(
+                    payload, resolved_team_member_id, preserve_text_values
+                )
+                if is_api_format:
+                    self._validate_property_data(api_data, "create")
+                api_payloads.append(api_data)
+
+            # Optionally collapse payloads that prepare to the same request,
+            # keyed on their canonical JSON form
+            result_keys: Optional[List[str]] = None
+            if deduplicate:
+                result_keys = [
+                    json.dumps(api_data, sort_keys=True, default=str)
+                    for api_data in api_payloads
+                ]
+                unique_payloads = {}
+                for key, api_data in zip(result_keys, api_payloads):
+                    if key not in unique_payloads:
+                        unique_payloads[key] = api_data
+
+                if len(unique_payloads) < len(api_payloads):
+                    logger.info(
+                        "Deduplicated bulk payloads from %d to %d",
+                        len(api_payloads),
+                        len(unique_payloads),
+                    )
+                api_payloads = list(unique_payloads.values())
+
+            logger.info("Creating %d properties in bulk", len(api_payloads))
+
+            def _create_one(api_data: Dict[str, Any]) -> Dict[str, Any]:
+                response = self.post("/properties/", json_data=api_data)
+                return self._process_response_data(response, "/properties/")
+
+            if max_workers is not None and max_workers > 1 and len(api_payloads) > 1:
+                # Fan the independent creation requests out over a bounded
+                # thread pool; map preserves input order in the results
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(api_payloads))
+                ) as executor:
+                    results = list(executor.map(_create_one, api_payloads))
+            else:
+                results = [_create_one(api_data) for api_data in api_payloads]
+
+            if result_keys is not None:
+                # Re-expand so duplicate inputs share their created property
+                created_by_key = dict(zip(unique_payloads.keys(), results))
+                results = [created_by_key[key] for key in result_keys]
+
+            logger.info("Successfully created %d properties in bulk", len(results))
+            return results
+
+        except Exception as e:
+            logger.error(
+                "Failed to create properties in bulk: %s",
+                e,
+                extra={"payload_count": len(payloads)},
+            )
+            raise
+
     def retrieve_property(self, property_id: int) -> Dict[str, Any]:
         """Retrieve a specific property by its ID with validation.
 
@@ -734,17 +1116,17 @@ class PropertiesAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(property_id, "property")
 
-            logger.info(f"Retrieving property with ID: {validated_id}")
+            logger.info("Retrieving property with ID: %d", validated_id)
             response = self.get(f"/properties/{validated_id}")
             result = self._process_response_data(
                 response, f"/properties/{validated_id}"
             )
 
-            logger.info(f"Successfully retrieved property: {validated_id}")
+            logger.info("Successfully retrieved property: %d", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve property {property_id}: {str(e)}")
+            logger.error("Failed to retrieve property %s: %s", property_id, e)
             raise
 
     def update_property(
@@ -783,21 +1165,25 @@ class PropertiesAPI(BaseClient):
             validated_id = self._validate_resource_id(property_id, "property")
             self._validate_property_data(property_data, "update")
 
-            logger.info(
-                f"Updating property with ID: {validated_id}",
-                extra={"update_fields": list(property_data.keys())},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Updating property with ID: %d",
+                    validated_id,
+                    extra={"update_fields": list(property_data.keys())},
+                )
             response = self.put(f"/properties/{validated_id}", json_data=property_data)
             result = self._process_response_data(
                 response, f"/properties/{validated_id}"
             )
 
-            logger.info(f"Successfully updated property: {validated_id}")
+            logger.info("Successfully updated property: %d", validated_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update property {property_id}: {str(e)}",
+                "Failed to update property %s: %s",
+                property_id,
+                e,
                 extra={
                     "property_data_keys": (
                         list(property_data.keys())
@@ -835,23 +1221,26 @@ class PropertiesAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(property_id, "property")
 
-            logger.info(f"Deleting property with ID: {validated_id}")
+            logger.info("Deleting property with ID: %d", validated_id)
             result = self.delete(f"/properties/{validated_id}")
 
-            logger.info(f"Successfully deleted property: {validated_id}")
+            logger.info("Successfully deleted property: %d", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to delete property {property_id}: {str(e)}")
+            logger.error("Failed to delete property %s: %s", property_id, e)
             raise
 
+    @cached_get(ttl=3600)
     def get_property_fields(self) -> List[Dict[str, Any]]:
         """Retrieve property field definitions from the API.
 
         This method fetches the complete list of available property fields
         with their definitions, types, and structure from the Open To Close API.
         This is useful for understanding what fields are available when creating
-        or updating properties.
+        or updating properties. Results are cached in-process for an hour
+        (clear early with invalidate_cache()); on expiry the refetch is
+        revalidated against the stored ETag.
 
         Returns:
             A list of dictionaries containing property field definitions.
@@ -883,14 +1272,55 @@ class PropertiesAPI(BaseClient):
         """
         try:
             logger.info("Retrieving property field definitions")
-            response = self.get("/propertyFields")
+            # Schema fetch: revalidate with ETag so unchanged definitions
+            # come back as a bodyless 304 served from the client cache
+            response = self.get("/propertyFields", etag_cache_key="propertyFields")
             result = self._process_list_response(response, "/propertyFields")
 
             logger.info(
-                f"Successfully retrieved property field definitions with {len(result)} field groups"
+                "Successfully retrieved property field definitions with %d field groups",
+                len(result),
             )
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve property fields: {str(e)}")
+            logger.error("Failed to retrieve property fields: %s", e)
             raise
+
+    def iter_property_fields(self) -> Iterator[Dict[str, Any]]:
+        """Yield property field group definitions one at a time.
+
+        With the optional ijson dependency installed, the response body is
+        parsed incrementally off the socket, so peak memory is proportional
+        to the largest field group rather than the full schema payload, and
+        parsing overlaps the network transfer. Without ijson this falls
+        back to get_property_fields() and iterates the materialized list.
+
+        Yields:
+            Property field group dictionaries, as in get_property_fields()
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+        """
+        if ijson is None:
+            yield from self.get_property_fields()
+            return
+
+        response = self._request_stream("/propertyFields")
+        try:
+            raw = response.raw
+
+            # Sniff the first significant byte: a bare JSON array streams
+            # at "item", the {"data": [...]} wrapper at "data.item"
+            first = raw.read(1)
+            while first.isspace():
+                first = raw.read(1)
+            prefix = "item" if first == b"[" else "data.item"
+
+            yield from ijson.items(_PrefixedReader(first, raw), prefix)
+        finally:
+            response.close()
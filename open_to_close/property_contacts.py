@@ -1,8 +1,11 @@
 """Property contacts client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -25,19 +28,30 @@ class PropertyContactsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the property contacts client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized PropertyContactsAPI client")
 
     def _validate_property_contact_data(
@@ -86,10 +100,11 @@ class PropertyContactsAPI(BaseClient):
         for field in unsupported_fields:
             if field in contact_data:
                 logger.warning(
-                    f"Field '{field}' is not supported by the property contacts API and will be ignored"
+                    "Field '%s' is not supported by the property contacts API and will be ignored",
+                    field,
                 )
 
-        logger.debug(f"Property contact data validated for {operation} operation")
+        logger.debug("Property contact data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -124,7 +139,7 @@ class PropertyContactsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -197,7 +212,8 @@ class PropertyContactsAPI(BaseClient):
             validated_params = self._validate_list_params(params)
 
             logger.info(
-                f"Listing contacts for property {validated_property_id}",
+                "Listing contacts for property %s",
+                validated_property_id,
                 extra={"params": validated_params},
             )
             response = self.get(
@@ -208,13 +224,17 @@ class PropertyContactsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved {len(result)} contacts for property {validated_property_id}"
+                "Successfully retrieved %d contacts for property %s",
+                len(result),
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to list contacts for property {property_id}: {str(e)}",
+                "Failed to list contacts for property %s: %s",
+                property_id,
+                e,
                 extra={"params": params},
             )
             raise
@@ -278,7 +298,8 @@ class PropertyContactsAPI(BaseClient):
             clean_data = {"contact_id": contact_data["contact_id"]}
 
             logger.info(
-                f"Creating contact association for property {validated_property_id}",
+                "Creating contact association for property %s",
+                validated_property_id,
                 extra={"contact_id": clean_data["contact_id"]},
             )
             response = self.post(
@@ -289,13 +310,17 @@ class PropertyContactsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully created contact association for property {validated_property_id} with ID {result.get('id')}"
+                "Successfully created contact association for property %s with ID %s",
+                validated_property_id,
+                result.get("id"),
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create contact association for property {property_id}: {str(e)}",
+                "Failed to create contact association for property %s: %s",
+                property_id,
+                e,
                 extra={
                     "contact_data_keys": (
                         list(contact_data.keys())
@@ -348,7 +373,9 @@ class PropertyContactsAPI(BaseClient):
             )
 
             logger.info(
-                f"Retrieving contact association {validated_contact_id} for property {validated_property_id}"
+                "Retrieving contact association %s for property %s",
+                validated_contact_id,
+                validated_property_id,
             )
             response = self.get(
                 f"/properties/{validated_property_id}/contacts/{validated_contact_id}"
@@ -359,13 +386,18 @@ class PropertyContactsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved contact association {validated_contact_id} for property {validated_property_id}"
+                "Successfully retrieved contact association %s for property %s",
+                validated_contact_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to retrieve contact association {contact_id} for property {property_id}: {str(e)}"
+                "Failed to retrieve contact association %s for property %s: %s",
+                contact_id,
+                property_id,
+                e,
             )
             raise
 
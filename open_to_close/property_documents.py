@@ -1,8 +1,11 @@
 """Property documents client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -18,19 +21,30 @@ class PropertyDocumentsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the property documents client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized PropertyDocumentsAPI client")
 
     def _validate_property_document_data(
@@ -111,7 +125,7 @@ class PropertyDocumentsAPI(BaseClient):
                     f"description must be a string, got {type(description).__name__}: {description}"
                 )
 
-        logger.debug(f"Property document data validated for {operation} operation")
+        logger.debug("Property document data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -146,7 +160,7 @@ class PropertyDocumentsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -221,7 +235,8 @@ class PropertyDocumentsAPI(BaseClient):
             validated_params = self._validate_list_params(params)
 
             logger.info(
-                f"Listing documents for property {validated_property_id}",
+                "Listing documents for property %s",
+                validated_property_id,
                 extra={"params": validated_params},
             )
             response = self.get(
@@ -233,13 +248,17 @@ class PropertyDocumentsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved {len(result)} documents for property {validated_property_id}"
+                "Successfully retrieved %d documents for property %s",
+                len(result),
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to list documents for property {property_id}: {str(e)}",
+                "Failed to list documents for property %s: %s",
+                property_id,
+                e,
                 extra={"params": params},
             )
             raise
@@ -287,7 +306,8 @@ class PropertyDocumentsAPI(BaseClient):
             self._validate_property_document_data(document_data, "create")
 
             logger.info(
-                f"Creating document for property {validated_property_id}",
+                "Creating document for property %s",
+                validated_property_id,
                 extra={"document_name": document_data.get("name", "unknown")},
             )
             response = self.post(
@@ -299,13 +319,15 @@ class PropertyDocumentsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully created document for property {validated_property_id}"
+                "Successfully created document for property %s", validated_property_id
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create document for property {property_id}: {str(e)}",
+                "Failed to create document for property %s: %s",
+                property_id,
+                e,
                 extra={
                     "document_data_keys": (
                         list(document_data.keys())
@@ -348,7 +370,9 @@ class PropertyDocumentsAPI(BaseClient):
             validated_document_id = self._validate_resource_id(document_id, "document")
 
             logger.info(
-                f"Retrieving document {validated_document_id} for property {validated_property_id}"
+                "Retrieving document %s for property %s",
+                validated_document_id,
+                validated_property_id,
             )
             response = self.get(
                 f"/properties/{validated_property_id}/documents/{validated_document_id}"
@@ -359,13 +383,18 @@ class PropertyDocumentsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved document {validated_document_id} for property {validated_property_id}"
+                "Successfully retrieved document %s for property %s",
+                validated_document_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to retrieve document {document_id} for property {property_id}: {str(e)}"
+                "Failed to retrieve document %s for property %s: %s",
+                document_id,
+                property_id,
+                e,
             )
             raise
 
@@ -409,7 +438,9 @@ class PropertyDocumentsAPI(BaseClient):
             self._validate_property_document_data(document_data, "update")
 
             logger.info(
-                f"Updating document {validated_document_id} for property {validated_property_id}",
+                "Updating document %s for property %s",
+                validated_document_id,
+                validated_property_id,
                 extra={"update_fields": list(document_data.keys())},
             )
             response = self.put(
@@ -422,13 +453,18 @@ class PropertyDocumentsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully updated document {validated_document_id} for property {validated_property_id}"
+                "Successfully updated document %s for property %s",
+                validated_document_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update document {document_id} for property {property_id}: {str(e)}",
+                "Failed to update document %s for property %s: %s",
+                document_id,
+                property_id,
+                e,
                 extra={
                     "document_data_keys": (
                         list(document_data.keys())
@@ -471,19 +507,26 @@ class PropertyDocumentsAPI(BaseClient):
             validated_document_id = self._validate_resource_id(document_id, "document")
 
             logger.info(
-                f"Removing document {validated_document_id} from property {validated_property_id}"
+                "Removing document %s from property %s",
+                validated_document_id,
+                validated_property_id,
             )
             result = self.delete(
                 f"/properties/{validated_property_id}/documents/{validated_document_id}"
             )
 
             logger.info(
-                f"Successfully removed document {validated_document_id} from property {validated_property_id}"
+                "Successfully removed document %s from property %s",
+                validated_document_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to remove document {document_id} from property {property_id}: {str(e)}"
+                "Failed to remove document %s from property %s: %s",
+                document_id,
+                property_id,
+                e,
             )
             raise
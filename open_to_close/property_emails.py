@@ -1,8 +1,11 @@
 """Property emails client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -18,19 +21,30 @@ class PropertyEmailsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the property emails client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized PropertyEmailsAPI client")
 
     def _validate_property_email_data(
@@ -117,7 +131,7 @@ class PropertyEmailsAPI(BaseClient):
                         f"recipients[{i}] must be a valid email address, got: {recipient}"
                     )
 
-        logger.debug(f"Property email data validated for {operation} operation")
+        logger.debug("Property email data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -152,7 +166,7 @@ class PropertyEmailsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -227,7 +241,8 @@ class PropertyEmailsAPI(BaseClient):
             validated_params = self._validate_list_params(params)
 
             logger.info(
-                f"Listing emails for property {validated_property_id}",
+                "Listing emails for property %s",
+                validated_property_id,
                 extra={"params": validated_params},
             )
             response = self.get(
@@ -238,13 +253,17 @@ class PropertyEmailsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved {len(result)} emails for property {validated_property_id}"
+                "Successfully retrieved %d emails for property %s",
+                len(result),
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to list emails for property {property_id}: {str(e)}",
+                "Failed to list emails for property %s: %s",
+                property_id,
+                e,
                 extra={"params": params},
             )
             raise
@@ -292,7 +311,8 @@ class PropertyEmailsAPI(BaseClient):
             self._validate_property_email_data(email_data, "create")
 
             logger.info(
-                f"Creating email for property {validated_property_id}",
+                "Creating email for property %s",
+                validated_property_id,
                 extra={"subject": email_data.get("subject", "unknown")},
             )
             response = self.post(
@@ -303,13 +323,15 @@ class PropertyEmailsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully created email for property {validated_property_id}"
+                "Successfully created email for property %s", validated_property_id
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create email for property {property_id}: {str(e)}",
+                "Failed to create email for property %s: %s",
+                property_id,
+                e,
                 extra={
                     "email_data_keys": (
                         list(email_data.keys())
@@ -352,7 +374,9 @@ class PropertyEmailsAPI(BaseClient):
             validated_email_id = self._validate_resource_id(email_id, "email")
 
             logger.info(
-                f"Retrieving email {validated_email_id} for property {validated_property_id}"
+                "Retrieving email %s for property %s",
+                validated_email_id,
+                validated_property_id,
             )
             response = self.get(
                 f"/properties/{validated_property_id}/emails/{validated_email_id}"
@@ -363,13 +387,18 @@ class PropertyEmailsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved email {validated_email_id} for property {validated_property_id}"
+                "Successfully retrieved email %s for property %s",
+                validated_email_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to retrieve email {email_id} for property {property_id}: {str(e)}"
+                "Failed to retrieve email %s for property %s: %s",
+                email_id,
+                property_id,
+                e,
             )
             raise
 
@@ -413,7 +442,9 @@ class PropertyEmailsAPI(BaseClient):
             self._validate_property_email_data(email_data, "update")
 
             logger.info(
-                f"Updating email {validated_email_id} for property {validated_property_id}",
+                "Updating email %s for property %s",
+                validated_email_id,
+                validated_property_id,
                 extra={"update_fields": list(email_data.keys())},
             )
             response = self.put(
@@ -426,13 +457,18 @@ class PropertyEmailsAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully updated email {validated_email_id} for property {validated_property_id}"
+                "Successfully updated email %s for property %s",
+                validated_email_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update email {email_id} for property {property_id}: {str(e)}",
+                "Failed to update email %s for property %s: %s",
+                email_id,
+                property_id,
+                e,
                 extra={
                     "email_data_keys": (
                         list(email_data.keys())
@@ -473,19 +509,26 @@ class PropertyEmailsAPI(BaseClient):
             validated_email_id = self._validate_resource_id(email_id, "email")
 
             logger.info(
-                f"Removing email {validated_email_id} from property {validated_property_id}"
+                "Removing email %s from property %s",
+                validated_email_id,
+                validated_property_id,
             )
             result = self.delete(
                 f"/properties/{validated_property_id}/emails/{validated_email_id}"
             )
 
             logger.info(
-                f"Successfully removed email {validated_email_id} from property {validated_property_id}"
+                "Successfully removed email %s from property %s",
+                validated_email_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to remove email {email_id} from property {property_id}: {str(e)}"
+                "Failed to remove email %s from property %s: %s",
+                email_id,
+                property_id,
+                e,
             )
             raise
@@ -1,8 +1,11 @@
 """Property notes client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -18,19 +21,30 @@ class PropertyNotesAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the property notes client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized PropertyNotesAPI client")
 
     def _validate_property_note_data(
@@ -118,7 +132,7 @@ class PropertyNotesAPI(BaseClient):
                         f"tags[{i}] must be a non-empty string, got: {tag}"
                     )
 
-        logger.debug(f"Property note data validated for {operation} operation")
+        logger.debug("Property note data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -153,7 +167,7 @@ class PropertyNotesAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -237,7 +251,8 @@ class PropertyNotesAPI(BaseClient):
             validated_params = self._validate_list_params(params)
 
             logger.info(
-                f"Listing notes for property {validated_property_id}",
+                "Listing notes for property %s",
+                validated_property_id,
                 extra={"params": validated_params},
             )
             response = self.get(
@@ -248,13 +263,17 @@ class PropertyNotesAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved {len(result)} notes for property {validated_property_id}"
+                "Successfully retrieved %d notes for property %s",
+                len(result),
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to list notes for property {property_id}: {str(e)}",
+                "Failed to list notes for property %s: %s",
+                property_id,
+                e,
                 extra={"params": params},
             )
             raise
@@ -303,7 +322,8 @@ class PropertyNotesAPI(BaseClient):
             self._validate_property_note_data(note_data, "create")
 
             logger.info(
-                f"Creating note for property {validated_property_id}",
+                "Creating note for property %s",
+                validated_property_id,
                 extra={"content_length": len(note_data.get("content", ""))},
             )
             response = self.post(
@@ -314,13 +334,15 @@ class PropertyNotesAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully created note for property {validated_property_id}"
+                "Successfully created note for property %s", validated_property_id
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create note for property {property_id}: {str(e)}",
+                "Failed to create note for property %s: %s",
+                property_id,
+                e,
                 extra={
                     "note_data_keys": (
                         list(note_data.keys())
@@ -361,7 +383,9 @@ class PropertyNotesAPI(BaseClient):
             validated_note_id = self._validate_resource_id(note_id, "note")
 
             logger.info(
-                f"Retrieving note {validated_note_id} for property {validated_property_id}"
+                "Retrieving note %s for property %s",
+                validated_note_id,
+                validated_property_id,
             )
             response = self.get(
                 f"/properties/{validated_property_id}/notes/{validated_note_id}"
@@ -372,13 +396,18 @@ class PropertyNotesAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved note {validated_note_id} for property {validated_property_id}"
+                "Successfully retrieved note %s for property %s",
+                validated_note_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to retrieve note {note_id} for property {property_id}: {str(e)}"
+                "Failed to retrieve note %s for property %s: %s",
+                note_id,
+                property_id,
+                e,
             )
             raise
 
@@ -423,7 +452,9 @@ class PropertyNotesAPI(BaseClient):
             self._validate_property_note_data(note_data, "update")
 
             logger.info(
-                f"Updating note {validated_note_id} for property {validated_property_id}",
+                "Updating note %s for property %s",
+                validated_note_id,
+                validated_property_id,
                 extra={"update_fields": list(note_data.keys())},
             )
             response = self.put(
@@ -436,13 +467,18 @@ class PropertyNotesAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully updated note {validated_note_id} for property {validated_property_id}"
+                "Successfully updated note %s for property %s",
+                validated_note_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update note {note_id} for property {property_id}: {str(e)}",
+                "Failed to update note %s for property %s: %s",
+                note_id,
+                property_id,
+                e,
                 extra={
                     "note_data_keys": (
                         list(note_data.keys())
@@ -483,19 +519,23 @@ class PropertyNotesAPI(BaseClient):
             validated_note_id = self._validate_resource_id(note_id, "note")
 
             logger.info(
-                f"Removing note {validated_note_id} from property {validated_property_id}"
+                "Removing note %s from property %s",
+                validated_note_id,
+                validated_property_id,
             )
             result = self.delete(
                 f"/properties/{validated_property_id}/notes/{validated_note_id}"
             )
 
             logger.info(
-                f"Successfully removed note {validated_note_id} from property {validated_property_id}"
+                "Successfully removed note %s from property %s",
+                validated_note_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to remove note {note_id} from property {property_id}: {str(e)}"
+                "Failed to remove note %s from property %s: %s", note_id, property_id, e
             )
             raise
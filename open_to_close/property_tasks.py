@@ -1,8 +1,11 @@
 """Property tasks client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -18,19 +21,30 @@ class PropertyTasksAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the property tasks client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized PropertyTasksAPI client")
 
     def _validate_property_task_data(
@@ -132,7 +146,7 @@ class PropertyTasksAPI(BaseClient):
                     f"is_completed must be a boolean, got {type(is_completed).__name__}: {is_completed}"
                 )
 
-        logger.debug(f"Property task data validated for {operation} operation")
+        logger.debug("Property task data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -167,7 +181,7 @@ class PropertyTasksAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -251,7 +265,8 @@ class PropertyTasksAPI(BaseClient):
             validated_params = self._validate_list_params(params)
 
             logger.info(
-                f"Listing tasks for property {validated_property_id}",
+                "Listing tasks for property %s",
+                validated_property_id,
                 extra={"params": validated_params},
             )
             response = self.get(
@@ -262,13 +277,17 @@ class PropertyTasksAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved {len(result)} tasks for property {validated_property_id}"
+                "Successfully retrieved %d tasks for property %s",
+                len(result),
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to list tasks for property {property_id}: {str(e)}",
+                "Failed to list tasks for property %s: %s",
+                property_id,
+                e,
                 extra={"params": params},
             )
             raise
@@ -318,7 +337,8 @@ class PropertyTasksAPI(BaseClient):
             self._validate_property_task_data(task_data, "create")
 
             logger.info(
-                f"Creating task for property {validated_property_id}",
+                "Creating task for property %s",
+                validated_property_id,
                 extra={"title": task_data.get("title", "unknown")},
             )
             response = self.post(
@@ -329,13 +349,15 @@ class PropertyTasksAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully created task for property {validated_property_id}"
+                "Successfully created task for property %s", validated_property_id
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create task for property {property_id}: {str(e)}",
+                "Failed to create task for property %s: %s",
+                property_id,
+                e,
                 extra={
                     "task_data_keys": (
                         list(task_data.keys())
@@ -376,7 +398,9 @@ class PropertyTasksAPI(BaseClient):
             validated_task_id = self._validate_resource_id(task_id, "task")
 
             logger.info(
-                f"Retrieving task {validated_task_id} for property {validated_property_id}"
+                "Retrieving task %s for property %s",
+                validated_task_id,
+                validated_property_id,
             )
             response = self.get(
                 f"/properties/{validated_property_id}/tasks/{validated_task_id}"
@@ -387,13 +411,18 @@ class PropertyTasksAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully retrieved task {validated_task_id} for property {validated_property_id}"
+                "Successfully retrieved task %s for property %s",
+                validated_task_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to retrieve task {task_id} for property {property_id}: {str(e)}"
+                "Failed to retrieve task %s for property %s: %s",
+                task_id,
+                property_id,
+                e,
             )
             raise
 
@@ -439,7 +468,9 @@ class PropertyTasksAPI(BaseClient):
             self._validate_property_task_data(task_data, "update")
 
             logger.info(
-                f"Updating task {validated_task_id} for property {validated_property_id}",
+                "Updating task %s for property %s",
+                validated_task_id,
+                validated_property_id,
                 extra={"update_fields": list(task_data.keys())},
             )
             response = self.put(
@@ -452,13 +483,18 @@ class PropertyTasksAPI(BaseClient):
             )
 
             logger.info(
-                f"Successfully updated task {validated_task_id} for property {validated_property_id}"
+                "Successfully updated task %s for property %s",
+                validated_task_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update task {task_id} for property {property_id}: {str(e)}",
+                "Failed to update task %s for property %s: %s",
+                task_id,
+                property_id,
+                e,
                 extra={
                     "task_data_keys": (
                         list(task_data.keys())
@@ -499,19 +535,23 @@ class PropertyTasksAPI(BaseClient):
             validated_task_id = self._validate_resource_id(task_id, "task")
 
             logger.info(
-                f"Removing task {validated_task_id} from property {validated_property_id}"
+                "Removing task %s from property %s",
+                validated_task_id,
+                validated_property_id,
             )
             result = self.delete(
                 f"/properties/{validated_property_id}/tasks/{validated_task_id}"
             )
 
             logger.info(
-                f"Successfully removed task {validated_task_id} from property {validated_property_id}"
+                "Successfully removed task %s from property %s",
+                validated_task_id,
+                validated_property_id,
             )
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to remove task {task_id} from property {property_id}: {str(e)}"
+                "Failed to remove task %s from property %s: %s", task_id, property_id, e
             )
             raise
@@ -1,8 +1,11 @@
 """Tags client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +20,30 @@ class TagsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the tags client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized TagsAPI client")
 
     def _validate_tag_data(self, tag_data: Dict[str, Any], operation: str) -> None:
@@ -116,7 +130,7 @@ class TagsAPI(BaseClient):
                     f"sort_order must be an integer, got {type(sort_order).__name__}: {sort_order}"
                 )
 
-        logger.debug(f"Tag data validated for {operation} operation")
+        logger.debug("Tag data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -151,7 +165,7 @@ class TagsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -233,11 +247,11 @@ class TagsAPI(BaseClient):
             response = self.get("/tags", params=validated_params)
             result = self._process_list_response(response, "/tags")
 
-            logger.info(f"Successfully retrieved {len(result)} tags")
+            logger.info("Successfully retrieved %d tags", len(result))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list tags: {str(e)}", extra={"params": params})
+            logger.error("Failed to list tags: %s", e, extra={"params": params})
             raise
 
     def create_tag(self, tag_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -285,12 +299,13 @@ class TagsAPI(BaseClient):
             result = self._process_response_data(response, "/tags")
 
             tag_id = result.get("id")
-            logger.info(f"Successfully created tag with ID: {tag_id}")
+            logger.info("Successfully created tag with ID: %s", tag_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create tag: {str(e)}",
+                "Failed to create tag: %s",
+                e,
                 extra={
                     "tag_data_keys": (
                         list(tag_data.keys())
@@ -328,15 +343,15 @@ class TagsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(tag_id, "tag")
 
-            logger.info(f"Retrieving tag with ID: {validated_id}")
+            logger.info("Retrieving tag with ID: %s", validated_id)
             response = self.get(f"/tags/{validated_id}")
             result = self._process_response_data(response, f"/tags/{validated_id}")
 
-            logger.info(f"Successfully retrieved tag: {validated_id}")
+            logger.info("Successfully retrieved tag: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve tag {tag_id}: {str(e)}")
+            logger.error("Failed to retrieve tag %s: %s", tag_id, e)
             raise
 
     def update_tag(self, tag_id: int, tag_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -374,18 +389,21 @@ class TagsAPI(BaseClient):
             self._validate_tag_data(tag_data, "update")
 
             logger.info(
-                f"Updating tag with ID: {validated_id}",
+                "Updating tag with ID: %s",
+                validated_id,
                 extra={"update_fields": list(tag_data.keys())},
             )
             response = self.put(f"/tags/{validated_id}", json_data=tag_data)
             result = self._process_response_data(response, f"/tags/{validated_id}")
 
-            logger.info(f"Successfully updated tag: {validated_id}")
+            logger.info("Successfully updated tag: %s", validated_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update tag {tag_id}: {str(e)}",
+                "Failed to update tag %s: %s",
+                tag_id,
+                e,
                 extra={
                     "tag_data_keys": (
                         list(tag_data.keys())
@@ -423,12 +441,12 @@ class TagsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(tag_id, "tag")
 
-            logger.info(f"Deleting tag with ID: {validated_id}")
+            logger.info("Deleting tag with ID: %s", validated_id)
             result = self.delete(f"/tags/{validated_id}")
 
-            logger.info(f"Successfully deleted tag: {validated_id}")
+            logger.info("Successfully deleted tag: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to delete tag {tag_id}: {str(e)}")
+            logger.error("Failed to delete tag %s: %s", tag_id, e)
             raise
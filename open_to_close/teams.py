@@ -1,8 +1,11 @@
 """Teams client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +20,30 @@ class TeamsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the teams client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized TeamsAPI client")
 
     def _validate_team_data(self, team_data: Dict[str, Any], operation: str) -> None:
@@ -107,7 +121,7 @@ class TeamsAPI(BaseClient):
                             f"members[{i}].user_id must be an integer, got {type(user_id).__name__}: {user_id}"
                         )
 
-        logger.debug(f"Team data validated for {operation} operation")
+        logger.debug("Team data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -142,7 +156,7 @@ class TeamsAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -207,11 +221,11 @@ class TeamsAPI(BaseClient):
             response = self.get("/teams", params=validated_params)
             result = self._process_list_response(response, "/teams")
 
-            logger.info(f"Successfully retrieved {len(result)} teams")
+            logger.info("Successfully retrieved %d teams", len(result))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list teams: {str(e)}", extra={"params": params})
+            logger.error("Failed to list teams: %s", e, extra={"params": params})
             raise
 
     def create_team(self, team_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -257,12 +271,13 @@ class TeamsAPI(BaseClient):
             result = self._process_response_data(response, "/teams")
 
             team_id = result.get("id")
-            logger.info(f"Successfully created team with ID: {team_id}")
+            logger.info("Successfully created team with ID: %s", team_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create team: {str(e)}",
+                "Failed to create team: %s",
+                e,
                 extra={
                     "team_data_keys": (
                         list(team_data.keys())
@@ -300,15 +315,15 @@ class TeamsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(team_id, "team")
 
-            logger.info(f"Retrieving team with ID: {validated_id}")
+            logger.info("Retrieving team with ID: %s", validated_id)
             response = self.get(f"/teams/{validated_id}")
             result = self._process_response_data(response, f"/teams/{validated_id}")
 
-            logger.info(f"Successfully retrieved team: {validated_id}")
+            logger.info("Successfully retrieved team: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve team {team_id}: {str(e)}")
+            logger.error("Failed to retrieve team %s: %s", team_id, e)
             raise
 
     def update_team(self, team_id: int, team_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -346,18 +361,21 @@ class TeamsAPI(BaseClient):
             self._validate_team_data(team_data, "update")
 
             logger.info(
-                f"Updating team with ID: {validated_id}",
+                "Updating team with ID: %s",
+                validated_id,
                 extra={"update_fields": list(team_data.keys())},
             )
             response = self.put(f"/teams/{validated_id}", json_data=team_data)
             result = self._process_response_data(response, f"/teams/{validated_id}")
 
-            logger.info(f"Successfully updated team: {validated_id}")
+            logger.info("Successfully updated team: %s", validated_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update team {team_id}: {str(e)}",
+                "Failed to update team %s: %s",
+                team_id,
+                e,
                 extra={
                     "team_data_keys": (
                         list(team_data.keys())
@@ -395,12 +413,12 @@ class TeamsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(team_id, "team")
 
-            logger.info(f"Deleting team with ID: {validated_id}")
+            logger.info("Deleting team with ID: %s", validated_id)
             result = self.delete(f"/teams/{validated_id}")
 
-            logger.info(f"Successfully deleted team: {validated_id}")
+            logger.info("Successfully deleted team: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to delete team {team_id}: {str(e)}")
+            logger.error("Failed to delete team %s: %s", team_id, e)
             raise
@@ -1,8 +1,11 @@
 """Users client for Open To Close API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +20,30 @@ class UsersAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """Initialize the users client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Requests session shared with other clients. Defaults
+                     to the process-wide pooled session.
+            executor: Thread pool shared with other clients for bulk
+                      helpers such as get_many. Defaults to a per-call
+                      pool.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key, base_url=base_url, session=session, executor=executor
+        )
         logger.debug("Initialized UsersAPI client")
 
     def _validate_user_data(self, user_data: Dict[str, Any], operation: str) -> None:
@@ -96,7 +110,7 @@ class UsersAPI(BaseClient):
                     f"status must be a non-empty string, got: {status}"
                 )
 
-        logger.debug(f"User data validated for {operation} operation")
+        logger.debug("User data validated for %s operation", operation)
 
     def _validate_list_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and normalize parameters for list operations.
@@ -131,7 +145,7 @@ class UsersAPI(BaseClient):
                     )
                 if limit_int > 1000:  # Reasonable upper bound
                     logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
+                        "Large limit value: %d. Consider using pagination.", limit_int
                     )
                 validated_params["limit"] = limit_int
             except (ValueError, TypeError):
@@ -197,11 +211,11 @@ class UsersAPI(BaseClient):
             response = self.get("/users", params=validated_params)
             result = self._process_list_response(response, "/users")
 
-            logger.info(f"Successfully retrieved {len(result)} users")
+            logger.info("Successfully retrieved %d users", len(result))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list users: {str(e)}", extra={"params": params})
+            logger.error("Failed to list users: %s", e, extra={"params": params})
             raise
 
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -250,12 +264,13 @@ class UsersAPI(BaseClient):
             result = self._process_response_data(response, "/users")
 
             user_id = result.get("id")
-            logger.info(f"Successfully created user with ID: {user_id}")
+            logger.info("Successfully created user with ID: %s", user_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to create user: {str(e)}",
+                "Failed to create user: %s",
+                e,
                 extra={
                     "user_data_keys": (
                         list(user_data.keys())
@@ -293,15 +308,15 @@ class UsersAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(user_id, "user")
 
-            logger.info(f"Retrieving user with ID: {validated_id}")
+            logger.info("Retrieving user with ID: %s", validated_id)
             response = self.get(f"/users/{validated_id}")
             result = self._process_response_data(response, f"/users/{validated_id}")
 
-            logger.info(f"Successfully retrieved user: {validated_id}")
+            logger.info("Successfully retrieved user: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to retrieve user {user_id}: {str(e)}")
+            logger.error("Failed to retrieve user %s: %s", user_id, e)
             raise
 
     def update_user(self, user_id: int, user_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -339,18 +354,21 @@ class UsersAPI(BaseClient):
             self._validate_user_data(user_data, "update")
 
             logger.info(
-                f"Updating user with ID: {validated_id}",
+                "Updating user with ID: %s",
+                validated_id,
                 extra={"update_fields": list(user_data.keys())},
             )
             response = self.put(f"/users/{validated_id}", json_data=user_data)
             result = self._process_response_data(response, f"/users/{validated_id}")
 
-            logger.info(f"Successfully updated user: {validated_id}")
+            logger.info("Successfully updated user: %s", validated_id)
             return result
 
         except Exception as e:
             logger.error(
-                f"Failed to update user {user_id}: {str(e)}",
+                "Failed to update user %s: %s",
+                user_id,
+                e,
                 extra={
                     "user_data_keys": (
                         list(user_data.keys())
@@ -388,12 +406,12 @@ class UsersAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(user_id, "user")
 
-            logger.info(f"Deleting user with ID: {validated_id}")
+            logger.info("Deleting user with ID: %s", validated_id)
             result = self.delete(f"/users/{validated_id}")
 
-            logger.info(f"Successfully deleted user: {validated_id}")
+            logger.info("Successfully deleted user: %s", validated_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to delete user {user_id}: {str(e)}")
+            logger.error("Failed to delete user %s: %s", user_id, e)
             raise
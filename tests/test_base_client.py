@@ -8,6 +8,7 @@ import requests
 from open_to_close.base_client import BaseClient
 from open_to_close.exceptions import (
     AuthenticationError,
+    ConfigurationError,
     NetworkError,
     NotFoundError,
     OpenToCloseAPIError,
@@ -460,3 +461,182 @@ class TestBaseClient:
             timeout=30.0,
         )
         assert result == {"submitted": True}
+
+    def test_session_shared_across_clients(self) -> None:
+        """Test that client instances reuse the shared pooled session."""
+        first_client = BaseClient(api_key="test_key")
+        second_client = BaseClient(api_key="other_key")
+
+        assert first_client.session is second_client.session
+
+    def test_session_can_be_injected(self) -> None:
+        """Test that an explicitly provided session is used as-is."""
+        custom_session = requests.Session()
+        client = BaseClient(api_key="test_key", session=custom_session)
+
+        assert client.session is custom_session
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_get_many_fans_out_and_preserves_order(
+        self, mock_session_request: Mock
+    ) -> None:
+        """Test that get_many returns results in input order."""
+        client = BaseClient(api_key="test_key")
+
+        def fake_request(method: str, url: str, **kwargs: object) -> Mock:
+            response = Mock(spec=requests.Response)
+            response.status_code = 200
+            response.content = f'{{"id": "{url.rsplit("/", 1)[-1]}"}}'.encode()
+            response.headers = {}
+            return response
+
+        mock_session_request.side_effect = fake_request
+
+        results = client.get_many(["/properties/1", "/properties/2", "/properties/3"])
+
+        assert results == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        assert mock_session_request.call_count == 3
+
+    def test_get_many_validates_params_list_length(self) -> None:
+        """Test that mismatched params_list length raises ValidationError."""
+        client = BaseClient(api_key="test_key")
+        with pytest.raises(ValidationError, match="params_list length"):
+            client.get_many(["/a", "/b"], params_list=[None])
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_iter_paginated_stops_on_short_page(
+        self, mock_session_request: Mock
+    ) -> None:
+        """Test that iter_paginated yields across pages and stops early."""
+        client = BaseClient(api_key="test_key")
+
+        full_page = Mock(spec=requests.Response)
+        full_page.status_code = 200
+        full_page.content = b'{"data": [{"id": 1}, {"id": 2}]}'
+        full_page.headers = {}
+
+        short_page = Mock(spec=requests.Response)
+        short_page.status_code = 200
+        short_page.content = b'{"data": [{"id": 3}]}'
+        short_page.headers = {}
+
+        mock_session_request.side_effect = [full_page, short_page]
+
+        items = list(client.iter_paginated("/properties", page_size=2))
+
+        assert items == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert mock_session_request.call_count == 2
+        first_params = mock_session_request.call_args_list[0].kwargs["params"]
+        second_params = mock_session_request.call_args_list[1].kwargs["params"]
+        assert (first_params["limit"], first_params["offset"]) == (2, 0)
+        assert (second_params["limit"], second_params["offset"]) == (2, 2)
+
+    def test_iter_paginated_validates_page_size(self) -> None:
+        """Test that a non-positive page_size raises ValidationError."""
+        client = BaseClient(api_key="test_key")
+        with pytest.raises(ValidationError, match="page_size"):
+            next(client.iter_paginated("/properties", page_size=0))
+
+    def test_session_retries_connections_but_not_statuses(self) -> None:
+        """Test that the mounted adapter retries connects, not HTTP statuses."""
+        client = BaseClient(api_key="test_key")
+        adapter = client.session.get_adapter("https://api.opentoclose.com/v1")
+        retry = adapter.max_retries
+        assert retry.connect == 3
+        # Status retries stay in _request's loop; the adapter must not
+        # duplicate them
+        assert not retry.status_forcelist
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_conditional_get_serves_304_from_cache(
+        self, mock_session_request: Mock
+    ) -> None:
+        """Test that a 304 revalidation returns the cached parsed body."""
+        client = BaseClient(api_key="test_key")
+
+        first = Mock(spec=requests.Response)
+        first.status_code = 200
+        first.content = b'{"data": [{"id": 1}]}'
+        first.headers = {"ETag": '"abc123"'}
+
+        not_modified = Mock(spec=requests.Response)
+        not_modified.status_code = 304
+        not_modified.content = b""
+        not_modified.headers = {}
+
+        mock_session_request.side_effect = [first, not_modified]
+
+        result = client.get("/propertyFields", etag_cache_key="propertyFields")
+        revalidated = client.get("/propertyFields", etag_cache_key="propertyFields")
+
+        assert result == {"data": [{"id": 1}]}
+        assert revalidated is result
+        # The second request must revalidate with the stored ETag
+        headers = mock_session_request.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"abc123"'}
+
+    def test_token_bucket_adapts_rate(self) -> None:
+        """Test AIMD rate adaptation of the pacing token bucket."""
+        from open_to_close.base_client import _TokenBucket
+
+        bucket = _TokenBucket(capacity=2, rate=100.0)
+        # Burst within capacity must not block
+        bucket.acquire()
+        bucket.acquire()
+
+        bucket.decrease()
+        assert bucket.rate == 50.0
+        bucket.increase()
+        assert bucket.rate == 50.1
+        # Recovery is capped at the configured rate
+        for _ in range(1000):
+            bucket.increase()
+        assert bucket.rate == 100.0
+
+    def test_rate_limit_rps_enables_pacing(self) -> None:
+        """Test that rate_limit_rps installs a token bucket on the client."""
+        client = BaseClient(api_key="test_key")
+        assert client._bucket is None
+
+        paced_client = BaseClient(api_key="test_key", rate_limit_rps=5)
+        assert paced_client._bucket is not None
+        assert paced_client._bucket.rate == 5.0
+
+    def test_accept_msgpack_without_msgpack_raises_configuration_error(self) -> None:
+        """Test that accept_msgpack fails clearly when msgpack is missing."""
+        from open_to_close import base_client
+
+        with patch.object(base_client, "msgpack", None):
+            with pytest.raises(ConfigurationError, match="msgpack"):
+                BaseClient(api_key="test_key", accept_msgpack=True)
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_msgpack_response_decoded(self, mock_session_request: Mock) -> None:
+        """Test that msgpack bodies are decoded and the Accept header sent."""
+        from open_to_close import base_client
+
+        decoder = Mock()
+        decoder.unpackb.return_value = {"id": 7}
+
+        response = Mock(spec=requests.Response)
+        response.status_code = 200
+        response.content = b"\x81\xa2id\x07"
+        response.headers = {"content-type": "application/msgpack"}
+        mock_session_request.return_value = response
+
+        with patch.object(base_client, "msgpack", decoder):
+            client = BaseClient(api_key="test_key", accept_msgpack=True)
+            result = client.get("/properties/7")
+
+        assert result == {"id": 7}
+        decoder.unpackb.assert_called_once_with(response.content, raw=False)
+        sent_headers = mock_session_request.call_args.kwargs["headers"]
+        assert sent_headers["Accept"].startswith("application/msgpack")
+
+    def test_async_client_without_httpx_raises_configuration_error(self) -> None:
+        """Test that AsyncBaseClient fails clearly when httpx is missing."""
+        from open_to_close import async_base_client
+
+        with patch.object(async_base_client, "httpx", None):
+            with pytest.raises(ConfigurationError, match="httpx is required"):
+                async_base_client.AsyncBaseClient(api_key="test_key")
@@ -1,10 +1,17 @@
 """Tests for core API endpoints."""
 
+import gzip
+import io
+import json
 import os
+import time
+from types import SimpleNamespace
+from typing import Any, Iterator
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
+import urllib3
 
 from open_to_close import OpenToCloseAPI
 from open_to_close.exceptions import AuthenticationError
@@ -320,6 +327,357 @@ class TestPropertiesAPI:
         # Expect 3 calls: 1 for field mappings, 1 for teams (auto-detection) and 1 for property creation
         assert mock_request.call_count == 3
 
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_create_properties_bulk(
+        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    ) -> None:
+        """Test creating multiple properties in one batched call."""
+        # Mock field mappings request
+        field_mappings_response = Mock(spec=requests.Response)
+        field_mappings_response.status_code = 200
+        field_mappings_response.json.return_value = [
+            {
+                "group": {
+                    "title": "Property Details",
+                    "sections": [
+                        {
+                            "section": {
+                                "title": "Basic Info",
+                                "fields": [
+                                    {
+                                        "id": 926565,
+                                        "key": "contract_title",
+                                        "title": "Contract Title",
+                                        "type": "text",
+                                    },
+                                    {
+                                        "id": 926553,
+                                        "key": "contract_client_type",
+                                        "title": "Contract Client Type",
+                                        "type": "choice",
+                                        "options": [
+                                            {"id": 797212, "title": "buyer"},
+                                            {"id": 797213, "title": "seller"},
+                                        ],
+                                    },
+                                    {
+                                        "id": 926552,
+                                        "key": "contract_status",
+                                        "title": "Contract Status",
+                                        "type": "choice",
+                                        "options": [
+                                            {"id": 797206, "title": "listing- active"},
+                                            {"id": 797207, "title": "under contract"},
+                                        ],
+                                    },
+                                ],
+                            }
+                        }
+                    ],
+                }
+            }
+        ]
+        field_mappings_response.headers = {}
+
+        # Mock teams request (for team member auto-detection)
+        teams_response = Mock(spec=requests.Response)
+        teams_response.status_code = 200
+        teams_response.json.return_value = [
+            {"team_members": [{"id": 26392, "name": "Test Member"}]}
+        ]
+        teams_response.headers = {}
+
+        # Mock property creation responses
+        first_property_response = Mock(spec=requests.Response)
+        first_property_response.status_code = 201
+        first_property_response.json.return_value = {"id": 1}
+        first_property_response.headers = {}
+
+        second_property_response = Mock(spec=requests.Response)
+        second_property_response.status_code = 201
+        second_property_response.json.return_value = {"id": 2}
+        second_property_response.headers = {}
+
+        mock_request.side_effect = [
+            teams_response,
+            field_mappings_response,
+            first_property_response,
+            second_property_response,
+        ]
+
+        properties = client.properties.create_properties_bulk(
+            [
+                {"title": "First Property", "client_type": "buyer"},
+                "Second Property",
+            ]
+        )
+
+        assert isinstance(properties, list)
+        assert [prop.get("id") for prop in properties] == [1, 2]
+        # Shared lookups are resolved once: 1 teams call, 1 field mappings
+        # call, then 1 creation call per payload
+        assert mock_request.call_count == 4
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_create_properties_bulk_concurrent(
+        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    ) -> None:
+        """Test bulk creation with a concurrent worker pool."""
+        client.properties._field_mappings_cache = {
+            "contract_title": {"id": 926565, "type": "text", "title": "Contract Title"},
+            "contract_client_type": {
+                "id": 926553,
+                "type": "choice",
+                "title": "Contract Client Type",
+                "options": {"buyer": 797212},
+            },
+            "contract_status": {
+                "id": 926552,
+                "type": "choice",
+                "title": "Contract Status",
+                "options": {"listing- active": 797206},
+            },
+        }
+
+        teams_response = Mock(spec=requests.Response)
+        teams_response.status_code = 200
+        teams_response.json.return_value = [
+            {"team_members": [{"id": 26392, "name": "Test Member"}]}
+        ]
+        teams_response.headers = {}
+
+        first_property_response = Mock(spec=requests.Response)
+        first_property_response.status_code = 201
+        first_property_response.json.return_value = {"id": 1}
+        first_property_response.content = b'{"id": 1}'
+        first_property_response.headers = {}
+
+        second_property_response = Mock(spec=requests.Response)
+        second_property_response.status_code = 201
+        second_property_response.json.return_value = {"id": 2}
+        second_property_response.content = b'{"id": 2}'
+        second_property_response.headers = {}
+
+        mock_request.side_effect = [
+            teams_response,
+            first_property_response,
+            second_property_response,
+        ]
+
+        properties = client.properties.create_properties_bulk(
+            ["First Property", "Second Property"], max_workers=2
+        )
+
+        # Responses may be assigned to either worker, so compare as a set
+        assert sorted(prop.get("id") for prop in properties) == [1, 2]
+        assert mock_request.call_count == 3
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_create_property_idempotency_key_memoizes_response(
+        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    ) -> None:
+        """Test that retried creates with the same idempotency key reuse the result."""
+        property_response = Mock(spec=requests.Response)
+        property_response.status_code = 201
+        property_response.json.return_value = {"id": 1}
+        property_response.content = b'{"id": 1}'
+        property_response.headers = {}
+        mock_request.return_value = property_response
+
+        api_format_data = {
+            "team_member_id": 26392,
+            "time_zone_id": 1,
+            "fields": [{"id": 926565, "key": "contract_title", "value": "Test"}],
+        }
+
+        first = client.properties.create_property(
+            api_format_data, idempotency_key="create-1"
+        )
+        second = client.properties.create_property(
+            api_format_data, idempotency_key="create-1"
+        )
+
+        assert first == {"id": 1}
+        assert second is first
+        # Only the first call issues a POST; the retry is served from cache
+        mock_request.assert_called_once()
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_create_properties_bulk_deduplicates_payloads(
+        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    ) -> None:
+        """Test that identical bulk payloads are only POSTed once."""
+        property_response = Mock(spec=requests.Response)
+        property_response.status_code = 201
+        property_response.json.return_value = {"id": 1}
+        property_response.content = b'{"id": 1}'
+        property_response.headers = {}
+        mock_request.return_value = property_response
+
+        api_format_data = {
+            "team_member_id": 26392,
+            "time_zone_id": 1,
+            "fields": [{"id": 926565, "key": "contract_title", "value": "Test"}],
+        }
+
+        properties = client.properties.create_properties_bulk(
+            [api_format_data, dict(api_format_data)], deduplicate=True
+        )
+
+        # Both entries map to the single created property
+        assert [prop.get("id") for prop in properties] == [1, 1]
+        mock_request.assert_called_once()
+
+    def test_create_properties_bulk_rejects_empty_list(
+        self, client: OpenToCloseAPI
+    ) -> None:
+        """Test that bulk creation rejects an empty payload list."""
+        from open_to_close.exceptions import ValidationError
+
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            client.properties.create_properties_bulk([])
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_field_mappings_fetched_once_across_creates(
+        self, mock_request: Mock, client: OpenToCloseAPI
+    ) -> None:
+        """Test that repeated creates reuse the cached field mappings."""
+        client.properties._cached_team_member_id = 26392
+
+        field_mappings_response = Mock(spec=requests.Response)
+        field_mappings_response.status_code = 200
+        field_mappings_response.json.return_value = [
+            {
+                "group": {
+                    "title": "Property Details",
+                    "sections": [
+                        {
+                            "section": {
+                                "title": "Basic Info",
+                                "fields": [
+                                    {
+                                        "id": 926565,
+                                        "key": "contract_title",
+                                        "title": "Contract Title",
+                                        "type": "text",
+                                    }
+                                ],
+                            }
+                        }
+                    ],
+                }
+            }
+        ]
+        field_mappings_response.headers = {}
+
+        property_response = Mock(spec=requests.Response)
+        property_response.status_code = 201
+        property_response.json.return_value = {"id": 1}
+        property_response.content = b'{"id": 1}'
+        property_response.headers = {}
+
+        mock_request.side_effect = [
+            field_mappings_response,
+            property_response,
+            property_response,
+        ]
+
+        client.properties.create_property({"contract_title": "First"})
+        client.properties.create_property({"contract_title": "Second"})
+
+        # One mappings fetch plus two creates; the second create hits the cache
+        assert mock_request.call_count == 3
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_team_member_id_memoized(
+        self, mock_request: Mock, client: OpenToCloseAPI
+    ) -> None:
+        """Test that team member auto-detection only fetches teams once."""
+        teams_response = Mock(spec=requests.Response)
+        teams_response.status_code = 200
+        teams_response.json.return_value = [
+            {"team_members": [{"id": 26392, "name": "Test Member"}]}
+        ]
+        teams_response.headers = {}
+        mock_request.return_value = teams_response
+
+        assert client.properties._get_team_member_id() == 26392
+        assert client.properties._get_team_member_id() == 26392
+        mock_request.assert_called_once()
+
+        # Invalidation forces the next call to re-run the detection
+        client.properties.invalidate_team_member_cache()
+        assert client.properties._get_team_member_id() == 26392
+        assert mock_request.call_count == 2
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_property_fields_ttl_cached(
+        self, mock_request: Mock, client: OpenToCloseAPI
+    ) -> None:
+        """Test that get_property_fields is served from the TTL cache."""
+        fields_response = Mock(spec=requests.Response)
+        fields_response.status_code = 200
+        fields_response.content = b'{"data": [{"id": 1}]}'
+        fields_response.headers = {}
+        mock_request.return_value = fields_response
+
+        assert client.properties.get_property_fields() == [{"id": 1}]
+        assert client.properties.get_property_fields() == [{"id": 1}]
+        mock_request.assert_called_once()
+
+        # Invalidation forces the next call back to the API
+        client.properties.invalidate_cache()
+        assert client.properties.get_property_fields() == [{"id": 1}]
+        assert mock_request.call_count == 2
+
+    @patch("open_to_close.base_client.requests.Session.request")
+    def test_iter_property_fields_decodes_gzip_stream(
+        self, mock_request: Mock, client: OpenToCloseAPI
+    ) -> None:
+        """Test that the streamed body is decompressed before sniffing."""
+        body = gzip.compress(b'[{"id": 1}, {"id": 2}]')
+        raw = urllib3.response.HTTPResponse(
+            body=io.BytesIO(body),
+            headers={"content-encoding": "gzip"},
+            status=200,
+            preload_content=False,
+        )
+
+        response = Mock(spec=requests.Response)
+        response.status_code = 200
+        response.raw = raw
+        mock_request.return_value = response
+
+        seen_prefixes = []
+
+        def fake_items(reader: Any, prefix: str) -> Iterator[Any]:
+            seen_prefixes.append(prefix)
+            payload = json.loads(reader.read(-1))
+            yield from payload if prefix == "item" else payload["data"]
+
+        fake_ijson = SimpleNamespace(items=fake_items)
+        with patch("open_to_close.properties.ijson", fake_ijson):
+            groups = list(client.properties.iter_property_fields())
+
+        # The gzip body decoded to a bare array, so the sniffed prefix is
+        # "item" and the items parse cleanly
+        assert seen_prefixes == ["item"]
+        assert groups == [{"id": 1}, {"id": 2}]
+        response.close.assert_called_once()
+
+    def test_iter_property_fields_without_ijson(self, client: OpenToCloseAPI) -> None:
+        """Test that the field iterator falls back to the list fetch."""
+        with patch("open_to_close.properties.ijson", None):
+            with patch.object(
+                client.properties,
+                "get_property_fields",
+                return_value=[{"id": 1}, {"id": 2}],
+            ) as mock_fetch:
+                groups = list(client.properties.iter_property_fields())
+
+        assert groups == [{"id": 1}, {"id": 2}]
+        mock_fetch.assert_called_once()
+
     @patch("open_to_close.base_client.requests.Session.request")
     def test_retrieve_property(
         self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
@@ -421,3 +779,172 @@ class TestClientIntegration:
         assert isinstance(client.property_emails, BaseClient)
         assert isinstance(client.property_notes, BaseClient)
         assert isinstance(client.property_tasks, BaseClient)
+
+    @patch("open_to_close.base_client.BaseClient._request")
+    def test_prefetch_fields_warms_mappings(self, mock_request: Mock) -> None:
+        """Test that prefetch_fields fetches mappings in the background."""
+        mock_request.return_value = [
+            {
+                "group": {
+                    "title": "Property Details",
+                    "sections": [
+                        {
+                            "section": {
+                                "title": "Basic Info",
+                                "fields": [
+                                    {
+                                        "id": 926565,
+                                        "key": "contract_title",
+                                        "title": "Contract Title",
+                                        "type": "text",
+                                    }
+                                ],
+                            }
+                        }
+                    ],
+                }
+            }
+        ]
+
+        prefetch_client = OpenToCloseAPI(api_key="test_key", prefetch_fields=True)
+        mappings = prefetch_client._get_cached_mappings()
+
+        assert "contract_title" in mappings
+        # The background fetch is the only request; consuming it does not
+        # trigger a second one
+        mock_request.assert_called_once()
+
+    def test_sub_clients_share_session(self, client: OpenToCloseAPI) -> None:
+        """Test that all sub-clients reuse the composite client's session."""
+        assert client.agents.session is client._session
+        assert client.contacts.session is client._session
+        assert client.properties.session is client._session
+        assert client.teams.session is client._session
+
+    def test_injected_session_reaches_sub_clients(self) -> None:
+        """Test that a caller-provided session is handed to sub-clients."""
+        custom_session = requests.Session()
+        client = OpenToCloseAPI(api_key="test_key", session=custom_session)
+
+        assert client._session is custom_session
+        assert client.properties.session is custom_session
+        assert client.teams.session is custom_session
+
+    def test_context_manager_closes_session(self) -> None:
+        """Test that exiting the context manager closes the session."""
+        from open_to_close import base_client
+
+        client = OpenToCloseAPI(api_key="test_key")
+        session = client._session
+        with patch.object(session, "close") as mock_close:
+            with client:
+                pass
+        mock_close.assert_called_once()
+        # The shared session is discarded so later clients get a fresh pool
+        assert base_client._shared_session is not session
+
+    def test_sub_clients_share_executor(self) -> None:
+        """Test that sub-clients reuse the composite client's thread pool."""
+        client = OpenToCloseAPI(api_key="test_key")
+        try:
+            assert client.properties._executor is client._executor
+            assert client.teams._executor is client._executor
+        finally:
+            client.close()
+
+    def test_close_shuts_down_executor(self) -> None:
+        """Test that close() shuts down the shared thread pool."""
+        client = OpenToCloseAPI(api_key="test_key")
+        client.close()
+        with pytest.raises(RuntimeError):
+            client._executor.submit(lambda: None)
+
+
+class TestClientValidation:
+    """Test client-side property data validation."""
+
+    @pytest.fixture
+    def mapped_client(self, client: OpenToCloseAPI) -> OpenToCloseAPI:
+        """Create a client with pre-populated field mappings."""
+        client.properties._field_mappings_cache = {
+            "contract_title": {"id": 926565, "type": "text", "title": "Contract Title"},
+            "contract_client_type": {
+                "id": 926553,
+                "type": "choice",
+                "title": "Contract Client Type",
+                "options": {"buyer": 797212, "seller": 797213, "dual": 797214},
+            },
+            "contract_status": {
+                "id": 926552,
+                "type": "choice",
+                "title": "Contract Status",
+                "options": {
+                    "under contract": 797207,
+                    "under-contract": 797207,
+                    "closed": 797210,
+                },
+            },
+        }
+        return client
+
+    def test_validate_property_data_valid(self, mapped_client: OpenToCloseAPI) -> None:
+        """Test validation of a valid simple payload."""
+        is_valid, errors = mapped_client.validate_property_data(
+            {"title": "Test Property", "client_type": "buyer", "status": "closed"}
+        )
+
+        assert is_valid
+        assert errors == []
+
+    def test_validate_property_data_reports_errors(
+        self, mapped_client: OpenToCloseAPI
+    ) -> None:
+        """Test validation errors for missing, unknown, and invalid fields."""
+        is_valid, errors = mapped_client.validate_property_data(
+            {"title": "Test", "client_type": "InvalidType", "unknown_field": 1}
+        )
+
+        assert not is_valid
+        assert any("Missing required field: contract_status" in e for e in errors)
+        assert any("Unknown field: unknown_field" in e for e in errors)
+        assert any(
+            "Invalid value 'InvalidType' for field 'contract_client_type'" in e
+            for e in errors
+        )
+
+    def test_validation_schema_recompiled_on_mapping_change(
+        self, mapped_client: OpenToCloseAPI
+    ) -> None:
+        """Test that the compiled schema is rebuilt when mappings change."""
+        first_schema = mapped_client._get_validation_schema()
+        assert mapped_client._get_validation_schema() is first_schema
+
+        # Simulate refresh_field_mappings replacing the cached mappings
+        mapped_client.properties._field_mappings_cache = dict(
+            mapped_client.properties._field_mappings_cache
+        )
+        assert mapped_client._get_validation_schema() is not first_schema
+
+    def test_cached_mappings_refreshed_after_ttl(
+        self, mapped_client: OpenToCloseAPI
+    ) -> None:
+        """Test that mappings are refetched once the TTL has elapsed."""
+        # Warm the composite cache, then age it past the TTL
+        mapped_client._get_cached_mappings()
+        mapped_client._field_mappings_fetched_at = time.monotonic() - 301
+
+        fresh_mappings = dict(mapped_client.properties._field_mappings_cache)
+        with patch.object(
+            mapped_client.properties,
+            "refresh_field_mappings",
+            return_value=fresh_mappings,
+        ) as mock_refresh:
+            assert mapped_client._get_cached_mappings() is fresh_mappings
+            mock_refresh.assert_called_once()
+
+        # The refresh resets the clock, so the next call hits the cache again
+        with patch.object(
+            mapped_client.properties, "refresh_field_mappings"
+        ) as mock_refresh:
+            mapped_client._get_cached_mappings()
+            mock_refresh.assert_not_called()
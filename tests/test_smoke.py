@@ -1,4 +1,7 @@
 # Basic smoke tests
+import subprocess
+import sys
+
 import open_to_close
 
 
@@ -7,6 +10,17 @@ def test_package_imports() -> None:
     assert hasattr(open_to_close, "__version__")
 
 
+def test_service_modules_import_lazily() -> None:
+    # Run in a fresh interpreter so earlier imports don't mask the behavior
+    code = (
+        "import sys, open_to_close; "
+        "assert 'open_to_close.agents' not in sys.modules; "
+        "assert open_to_close.AgentsAPI; "
+        "assert 'open_to_close.agents' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_basic_client_instantiation() -> None:
     client = open_to_close.OpenToCloseAPI("test_key")
     assert client is not None